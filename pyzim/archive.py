@@ -549,7 +549,7 @@ class Zim(ModifiableMixIn):
 
         # Log helper -  print dirty state
         logger.debug("Dirty state at the start of flush():")
-        for submodifiable in self._submodifiables:
+        for submodifiable in self._submodifiables.values():
             if submodifiable.dirty:
                 logger.debug("Submodifiable {} is dirty".format(repr(submodifiable)))
 
@@ -647,7 +647,7 @@ class Zim(ModifiableMixIn):
             new_cpl_position = self.spaceallocator.allocate(new_cpl_size)
             with self.acquire_file() as f:
                 f.seek(self._base_offset + new_cpl_position)
-                f.write(self._cluster_pointer_list.to_bytes())
+                self._cluster_pointer_list.write_to(f)
             self.header.cluster_pointer_position = new_cpl_position
             self.header.cluster_count = len(self._cluster_pointer_list)
             self._cluster_pointer_list.after_flush_or_read()
@@ -661,7 +661,7 @@ class Zim(ModifiableMixIn):
             new_upl_position = self.spaceallocator.allocate(new_upl_size)
             with self.acquire_file() as f:
                 f.seek(self._base_offset + new_upl_position)
-                f.write(self._url_pointer_list.to_bytes())
+                self._url_pointer_list.write_to(f)
             self.header.url_pointer_position = new_upl_position
             self.header.entry_count = len(self._url_pointer_list)
             self._url_pointer_list.after_flush_or_read()
@@ -892,6 +892,31 @@ class Zim(ModifiableMixIn):
             raise EntryNotFound("No entry for full URL '{}'".format(full_url))
         return self.get_entry_at(location)
 
+    def get_entries_by_full_urls(self, full_urls):
+        """
+        Return the entries at the specified full URLs.
+
+        This is equivalent to calling L{Zim.get_entry_by_full_url} for
+        each full URL, but the entries are read in the order of their
+        location in the ZIM file, reducing the seeks needed when
+        requesting many entries at once.
+
+        @param full_urls: full URLs of entries to get
+        @type full_urls: iterable of L{str}
+        @return: the entries at the specified URLs, in the same order as the URLs
+        @rtype: L{list} of L{pyzim.entry.BaseEntry}
+        @raises pyzim.exceptions.EntryNotFound: when no entry matches one of the specified URLs
+        """
+        locations = []
+        for full_url in full_urls:
+            assert isinstance(full_url, str)
+            try:
+                locations.append(self._url_pointer_list.get(full_url))
+            except KeyError:
+                raise EntryNotFound("No entry for full URL '{}'".format(full_url))
+        entries = {location: self.get_entry_at(location) for location in sorted(set(locations))}
+        return [entries[location] for location in locations]
+
     def get_entry_by_url_index(self, i, allow_cache_replacement=True):
         """
         Return the entry at the specified index in the URL pointer list.
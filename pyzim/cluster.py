@@ -7,9 +7,10 @@ from contextlib import contextmanager
 from . import constants
 from .bindable import BindableMixIn
 from .blob import BaseBlobSource, EmptyBlobSource
+from .cache import LastAccessCache
 from .compression import CompressionType, CompressionRegistry, DecompressingReader
 from .exceptions import BindRequired, UnsupportedCompressionType, BlobNotFound
-from .modifiable import ModifiableMixIn
+from .modifiable import ModifiableMixIn, cached_disk_size
 
 
 class Cluster(BindableMixIn):
@@ -510,6 +511,52 @@ class OffsetRememberingCluster(Cluster):
                 yield offset
 
 
+class BlobCachingCluster(OffsetRememberingCluster):
+    """
+    A variation of L{Cluster} that keeps the content of the most
+    recently read blobs in memory.
+
+    Unlike L{InMemoryCluster}, only the blobs that are actually read are
+    kept in memory, so that repeatedly reading the same blob does not
+    decompress it again.
+
+    @cvar BLOB_CACHE_SIZE: maximum number of blobs to keep in memory
+    @type BLOB_CACHE_SIZE: L{int}
+
+    @ivar _blob_cache: cache for the blob contents, keyed by blob index
+    @type _blob_cache: L{pyzim.cache.LastAccessCache}
+    """
+
+    BLOB_CACHE_SIZE = 4
+
+    def __init__(self, zim=None, offset=None):
+        OffsetRememberingCluster.__init__(self, zim=zim, offset=offset)
+        self._blob_cache = LastAccessCache(max_size=self.BLOB_CACHE_SIZE)
+
+    def reset(self):
+        self._blob_cache.clear()
+        OffsetRememberingCluster.reset(self)
+
+    def read_blob(self, i):
+        assert isinstance(i, int) and i >= 0
+        if self._blob_cache.has(i):
+            return self._blob_cache.get(i)
+        data = OffsetRememberingCluster.read_blob(self, i)
+        self._blob_cache.push(i, data)
+        return data
+
+    def iter_read_blob(self, i, buffersize=4096):
+        assert isinstance(i, int) and i >= 0
+        assert isinstance(buffersize, int) and buffersize > 0
+        if not self._blob_cache.has(i):
+            # do not cache blobs read iteratively, as they may be large
+            yield from OffsetRememberingCluster.iter_read_blob(self, i, buffersize=buffersize)
+            return
+        data = self._blob_cache.get(i)
+        for cur_pos in range(0, len(data), buffersize):
+            yield data[cur_pos:cur_pos + buffersize]
+
+
 class InMemoryCluster(OffsetRememberingCluster):
     """
     A variation of L{Cluster} that decompresses only once, storing all
@@ -719,10 +766,15 @@ class ModifiableClusterWrapper(Cluster, ModifiableMixIn):
         self._blobs = {}
         self._added_blobs = []
         self._removed_blobs = []
+        self._cached_disk_size = None
         Cluster.reset(self)
 
     def after_flush_or_read(self):
+        # the content now matches the disk, so resetting the
+        # modifications does not change the size
+        disk_size = self._cached_disk_size
         self.reset()
+        self._cached_disk_size = disk_size
         ModifiableMixIn.after_flush_or_read(self)
 
     @property
@@ -1040,6 +1092,7 @@ class ModifiableClusterWrapper(Cluster, ModifiableMixIn):
         """
         assert isinstance(value, bool) or (value is None)
         self._force_extension = value
+        self._cached_disk_size = None
 
     @property
     def offset(self):
@@ -1092,6 +1145,7 @@ class ModifiableClusterWrapper(Cluster, ModifiableMixIn):
             except ValueError:
                 raise UnsupportedCompressionType("Compression type {} not known!".format(value))
         self._force_compression = value
+        self._cached_disk_size = None
         if value is not None:
             self.mark_dirty()
 
@@ -1162,6 +1216,8 @@ class ModifiableClusterWrapper(Cluster, ModifiableMixIn):
     def get_total_offset_size(self):
         if not self.bound:
             raise BindRequired("Accessing blob offsets requires the cluster to be bound first!")
+        # the pointer format depends on the infobyte
+        self.read_infobyte_if_needed()
         total_offset_size = struct.calcsize(self._pointer_format) * self.get_number_of_offsets()
         return total_offset_size
 
@@ -1246,6 +1302,7 @@ class ModifiableClusterWrapper(Cluster, ModifiableMixIn):
         # even when using the same compression type
         return self._cluster.get_total_compressed_size()
 
+    @cached_disk_size
     def get_disk_size(self):
         # we can only know the compressed size by compressing it
         size = 0
@@ -1272,11 +1329,15 @@ class ModifiableClusterWrapper(Cluster, ModifiableMixIn):
         BindableMixIn.bind(self, zim)
         if not self._cluster.bound:
             self._cluster.bind(zim)
+        # the disk size depends on the compression options of the archive
+        self._cached_disk_size = None
 
     def unbind(self):
         # we also need to unbind the wrapped cluster
         BindableMixIn.unbind(self)
         self._cluster.unbind()
+        # the disk size depends on the compression options of the archive
+        self._cached_disk_size = None
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -792,6 +792,7 @@ class PyZstdCompressionInterface(BaseCompressionInterface):
 
         - zstd.option: a zstd level (L{int}) or advanced compression parameters (L{dict})
         - zstd.dict: pre-trained dictionary for compression (type C{pyzstd.ZstdDict})
+        - zstd.workers: number of threads to compress with (default: 0, compress in the calling thread) (only for compression)
     """
 
     compression_type = CompressionType.ZSTD
@@ -808,6 +809,16 @@ class PyZstdCompressionInterface(BaseCompressionInterface):
                 level_or_option = 22
             elif target in (CompressionTarget.FASTEST_COMPRESSION, CompressionTarget.FASTEST_DECOMPRESSION):
                 level_or_option = 2
+        workers = options.get("zstd.workers", 0)
+        if workers:
+            # multi-threaded compression requires advanced compression parameters
+            if isinstance(level_or_option, dict):
+                level_or_option = dict(level_or_option)
+            elif level_or_option is None:
+                level_or_option = {}
+            else:
+                level_or_option = {pyzstd.CParameter.compressionLevel: level_or_option}
+            level_or_option[pyzstd.CParameter.nbWorkers] = workers
         return pyzstd.ZstdCompressor(level_or_option=level_or_option, zstd_dict=zdict)
 
     @staticmethod
@@ -34,6 +34,10 @@ class BaseEntry(BindableMixIn, ModifiableMixIn):
     @type _url: L{str}
     @ivar _title: title of this entry
     @type _title: L{str}
+    @ivar _encoded_url: cached encoded form of the url, L{None} if not yet encoded
+    @type _encoded_url: L{bytes} or L{None}
+    @ivar _encoded_title: cached encoded form of the title, L{None} if not yet encoded
+    @type _encoded_title: L{bytes} or L{None}
     @ivar _parameters: extra parameters. Unused, must be None.
     @type _parameters: L{None}
     @ivar _old_full_url: full URL of entry as of last read/flush
@@ -88,6 +92,8 @@ class BaseEntry(BindableMixIn, ModifiableMixIn):
         self._url = url
         self._title = title
         self._parameters = parameters
+        self._encoded_url = None
+        self._encoded_title = None
 
         self._old_full_url = None
         self._force_is_article = None
@@ -232,6 +238,7 @@ class BaseEntry(BindableMixIn, ModifiableMixIn):
         self.ensure_mutable()
         if ustring != self._url:
             self._url = ustring
+            self._encoded_url = bstring
             self.mark_dirty()
 
     @property
@@ -275,6 +282,7 @@ class BaseEntry(BindableMixIn, ModifiableMixIn):
         self.ensure_mutable()
         if ustring != self._title:
             self._title = ustring
+            self._encoded_title = bstring
             self.mark_dirty()
 
     @property
@@ -309,6 +317,38 @@ class BaseEntry(BindableMixIn, ModifiableMixIn):
             self._parameters = value
             self.mark_dirty()
 
+    def _get_encoded_url(self):
+        """
+        Return the encoded url of this entry.
+
+        The encoded url is cached, so repeated calls (e.g. to determine
+        the size of this entry and to dump it) only encode it once.
+
+        @return: the encoded url
+        @rtype: L{bytes}
+        """
+        if self._encoded_url is None:
+            self._encoded_url = self._url.encode(constants.ENCODING)
+        return self._encoded_url
+
+    def _get_encoded_title(self):
+        """
+        Return the encoded title of this entry as it should be stored.
+
+        Unlike L{BaseEntry.title}, this does not fall back to the url
+        if no title is set, but returns an empty bytestring instead.
+        The result is cached like in L{BaseEntry._get_encoded_url}.
+
+        @return: the encoded title
+        @rtype: L{bytes}
+        """
+        if self._encoded_title is None:
+            if self._title:
+                self._encoded_title = self._title.encode(constants.ENCODING)
+            else:
+                self._encoded_title = b""
+        return self._encoded_title
+
     @property
     def is_redirect(self):
         """
@@ -705,11 +745,8 @@ class ContentEntry(BaseEntry):
         )
 
     def get_disk_size(self):
-        url_size = len(self.url.encode(constants.ENCODING)) + 1  # 1 for the null byte
-        if self._title:
-            title_size = len(self.title.encode(constants.ENCODING)) + 1  # 1 for the null byte
-        else:
-            title_size = 1  # for the 0 byte
+        url_size = len(self._get_encoded_url()) + 1  # 1 for the null byte
+        title_size = len(self._get_encoded_title()) + 1  # 1 for the null byte
         if self.parameters:
             # parameter handling not yet implemented
             raise NotImplementedError("get_disk_size() does not yet support parameters!")
@@ -727,8 +764,8 @@ class ContentEntry(BaseEntry):
             self.cluster_number,
             self.blob_number,
         )
-        data += self.url.encode(constants.ENCODING) + b"\x00"
-        data += self._title.encode(constants.ENCODING) + b"\x00"
+        data += self._get_encoded_url() + b"\x00"
+        data += self._get_encoded_title() + b"\x00"
         # if any parameters were here, they would now be appended
         return data
 
@@ -936,11 +973,8 @@ class RedirectEntry(BaseEntry):
         )
 
     def get_disk_size(self):
-        url_size = len(self.url.encode(constants.ENCODING)) + 1  # 1 for the null byte
-        if self._title:
-            title_size = len(self.title.encode(constants.ENCODING)) + 1  # 1 for the null byte
-        else:
-            title_size = 1  # for the null byte
+        url_size = len(self._get_encoded_url()) + 1  # 1 for the null byte
+        title_size = len(self._get_encoded_title()) + 1  # 1 for the null byte
         if self.parameters:
             # parameter handling not yet implemented
             raise NotImplementedError("get_disk_size() does not yet support parameters!")
@@ -957,8 +991,8 @@ class RedirectEntry(BaseEntry):
             0,  # revision,
             self.redirect_index,
         )
-        data += self.url.encode(constants.ENCODING) + b"\x00"
-        data += self._title.encode(constants.ENCODING) + b"\x00"
+        data += self._get_encoded_url() + b"\x00"
+        data += self._get_encoded_title() + b"\x00"
         # if any parameters were here, they would now be appended
         return data
 
@@ -9,6 +9,70 @@ from .modifiable import ModifiableMixIn
 from .exceptions import NotAZimFile, IncompatibleZimFile
 
 
+# template used by Header.__str__()
+_STR_TEMPLATE = """
+Magic number: {mn}
+Version: {mjv} (major) / {mnv} (minor)
+UUID: {uuid}
+Content: {ne} entries, {nc} clusters
+Offsets:
+    Directory pointer list: {upl}
+    Cluster pointer list: {cpl}
+    Title pointer list: {tpl}
+    Mime type list: {mtl}
+    Checksum: {cs}
+Pages:
+    Main: {mp}
+    Layout: {lp}
+        """
+
+
+def _uint_property(name, doc):
+    """
+    Create a property for a non-negative integer field of a L{Header}.
+
+    The value is stored in the attribute C{"_" + name}. The setter checks
+    the type and value, ensures the header is mutable and marks the
+    header as dirty if the value has been changed.
+
+    @param name: name of the property
+    @type name: L{str}
+    @param doc: description of the field
+    @type doc: L{str}
+    @return: the property
+    @rtype: L{property}
+    """
+    attr = "_" + name
+
+    def fget(self):
+        return getattr(self, attr)
+
+    def fset(self, value):
+        if (value == getattr(self, attr)) and isinstance(value, int):
+            # unchanged, nothing to do
+            return
+        if not isinstance(value, int):
+            raise TypeError("Expected int, got {}".format(type(value)))
+        if value < 0:
+            raise ValueError("Value can not be negative!")
+        self.ensure_mutable()
+        setattr(self, attr, value)
+        self.mark_dirty()
+
+    fget.__name__ = fset.__name__ = name
+    return property(
+        fget,
+        fset,
+        doc=(
+            doc + "\n\n"
+            "@raises TypeError: on set, if value is not an integer\n"
+            "@raises ValueError: on set, if the value is invalid (e.g. negative)\n"
+            "@raises pyzim.exceptions.NonMutable: on set, if this header is set to be inmutable.\n"
+            "@type: L{int}"
+        ),
+    )
+
+
 class Header(ModifiableMixIn):
     """
     The header of a ZIM file.
@@ -22,6 +86,8 @@ class Header(ModifiableMixIn):
     @type FORMAT: L{str}
     @cvar LENGTH: length of the ZIM header
     @type LENGTH: L{int}
+    @cvar STRUCT: precompiled struct for L{Header.FORMAT}
+    @type STRUCT: L{struct.Struct}
 
     @ivar _magic_number: magic number of this ZIM file.
     @type _magic_number: L{int}
@@ -29,8 +95,10 @@ class Header(ModifiableMixIn):
     @type _major_version : L{int}
     @ivar _minor_version: the minor version of this ZIM file
     @type _minor_version: L{int}
-    @ivar _uuid: uuid of the ZIM file
-    @type _uuid: L{uuid.UUID}
+    @ivar _uuid: uuid of the ZIM file, L{None} if not yet converted from L{Header._raw_uuid}
+    @type _uuid: L{uuid.UUID} or L{None}
+    @ivar _raw_uuid: the uuid as stored in the header (little endian bytes), L{None} if not known
+    @type _raw_uuid: L{bytes} or L{None}
     @ivar _entry_count: number of entries in the archive
     @type _entry_count: L{int}
     @ivar _cluster_count: number of clusters in the archive
@@ -50,9 +118,28 @@ class Header(ModifiableMixIn):
     @ivar _checksum_position: offset to the checksum
     @type _checksum_position: L{int}
     """
+    # fields set via _uint_property() store their value in a slot with a leading "_"
+    __slots__ = (
+        "_magic_number",
+        "_major_version",
+        "_minor_version",
+        "_uuid",
+        "_raw_uuid",
+        "_entry_count",
+        "_cluster_count",
+        "_url_pointer_position",
+        "_title_pointer_position",
+        "_cluster_pointer_position",
+        "_mime_list_position",
+        "_main_page",
+        "_layout_page",
+        "_checksum_position",
+    )
+
     MAGIC_NUMBER = 72173914
     FORMAT = constants.ENDIAN + "IHH16sIIQQQQIIQ"
-    LENGTH = struct.calcsize(FORMAT)
+    STRUCT = struct.Struct(FORMAT)
+    LENGTH = STRUCT.size
 
     def __init__(
         self,
@@ -124,10 +211,15 @@ class Header(ModifiableMixIn):
         self._magic_number = magic_number
         self._major_version = major_version
         self._minor_version = minor_version
+        self._raw_uuid = None
         if isinstance(uuid, int):
             self._uuid = pyuuid.UUID(int=uuid)
         elif isinstance(uuid, bytes):
-            self._uuid = pyuuid.UUID(bytes_le=uuid)
+            # only construct the UUID object when it is actually needed
+            if len(uuid) != 16:
+                raise ValueError("uuid bytes must be of length 16, got {}!".format(len(uuid)))
+            self._uuid = None
+            self._raw_uuid = uuid
         elif isinstance(uuid, pyuuid.UUID):
             self._uuid = uuid
         else:
@@ -183,37 +275,21 @@ class Header(ModifiableMixIn):
         @return: a string describing the header
         @rtype: L{str}
         """
-        template = """
-Magic number: {mn}
-Version: {mjv} (major) / {mnv} (minor)
-UUID: {uuid}
-Content: {ne} entries, {nc} clusters
-Offsets:
-    Directory pointer list: {upl}
-    Cluster pointer list: {cpl}
-    Title pointer list: {tpl}
-    Mime type list: {mtl}
-    Checksum: {cs}
-Pages:
-    Main: {mp}
-    Layout: {lp}
-        """
-        filled = template.format(
-            mn=self.magic_number,
-            mjv=self.major_version,
-            mnv=self.minor_version,
+        return _STR_TEMPLATE.format(
+            mn=self._magic_number,
+            mjv=self._major_version,
+            mnv=self._minor_version,
             uuid=self.uuid,
-            ne=self.entry_count,
-            nc=self.cluster_count,
-            upl=self.url_pointer_position,
-            cpl=self.cluster_pointer_position,
-            tpl=self.title_pointer_position,
-            mtl=self.mime_list_position,
-            cs=self.checksum_position,
-            mp=(self.main_page if self.has_main_page else "none"),
-            lp=(self.layout_page if self.has_layout_page else "none"),
+            ne=self._entry_count,
+            nc=self._cluster_count,
+            upl=self._url_pointer_position,
+            cpl=self._cluster_pointer_position,
+            tpl=self._title_pointer_position,
+            mtl=self._mime_list_position,
+            cs=self._checksum_position,
+            mp=(self._main_page if self._main_page != 0xffffffff else "none"),
+            lp=(self._layout_page if self._layout_page != 0xffffffff else "none"),
         )
-        return filled
 
     def check_compatible(self):
         """
@@ -234,108 +310,143 @@ Pages:
             raise IncompatibleZimFile("PyZim currently only supports the new ZIM namespace format")
 
     # =============== properties ===============
-    # the following set of functions may seem rather long, but in actuality
-    # they do mostly the same, just for different attributes
-    # These functions are properties whose main task is to track whether
+    # These are properties whose main task is to track whether
     # the value has been modified, so we know if we have to re-write
     # the header
+    # Most fields are plain non-negative integers, whose properties are
+    # generated by _uint_property(). Their docstrings are repeated as
+    # string literals so that pydoctor can pick them up statically.
+    # The remaining ones are defined below.
     #
     # Each of the properties behave as following:
     # getter:
     #   1. return the value of the attribute
     #   1.1. some values may be converted (e.g. main_page -> None) if not set
     # setter:
-    #   1. check if type and value are valid
-    #   2. sometimes, the value may be converted
-    #   3. ensure the header is allowed be be modified
-    #   4. if the value differs, change the value and mark header as dirty
+    #   1. if the value is unchanged, return immediately
+    #   2. check if type and value are valid
+    #   3. sometimes, the value may be converted
+    #   4. ensure the header is allowed be be modified
+    #   5. change the value and mark header as dirty
 
-    @property
-    def magic_number(self):
-        """
-        The magic number of this ZIM file.
+    major_version = _uint_property("major_version", "The major version of this ZIM file.")
+    """
+    The major version of this ZIM file.
 
-        @return: the magic number of this ZIM file.
-        @rtype: L{int}
-        """
-        return self._magic_number
+    @raises TypeError: on set, if value is not an integer
+    @raises ValueError: on set, if the value is invalid (e.g. negative)
+    @raises pyzim.exceptions.NonMutable: on set, if this header is set to be inmutable.
+    @type: L{int}
+    """
 
-    @magic_number.setter
-    def magic_number(self, value):
-        """
-        The magic number of this ZIM file.
+    minor_version = _uint_property("minor_version", "The minor version of this ZIM file.")
+    """
+    The minor version of this ZIM file.
 
-        @param value: value to set
-        @type value: L{int}
-        @raises TypeError: if value is not an integer
-        @raises pyzim.exceptions.NonMutable: if this header is set to be inmutable.
-        """
-        if not isinstance(value, int):
-            raise TypeError("Expected int, got {}".format(type(value)))
-        self.ensure_mutable()
-        if value != self._magic_number:
-            self._magic_number = value
-            self.mark_dirty()
+    @raises TypeError: on set, if value is not an integer
+    @raises ValueError: on set, if the value is invalid (e.g. negative)
+    @raises pyzim.exceptions.NonMutable: on set, if this header is set to be inmutable.
+    @type: L{int}
+    """
 
-    @property
-    def major_version(self):
-        """
-        The major version of this ZIM file.
+    entry_count = _uint_property("entry_count", "The number of entries in this archive.")
+    """
+    The number of entries in this archive.
 
-        @return: the major version of this ZIM file.
-        @rtype: L{int}
-        """
-        return self._major_version
+    @raises TypeError: on set, if value is not an integer
+    @raises ValueError: on set, if the value is invalid (e.g. negative)
+    @raises pyzim.exceptions.NonMutable: on set, if this header is set to be inmutable.
+    @type: L{int}
+    """
 
-    @major_version.setter
-    def major_version(self, value):
-        """
-        The major version of this ZIM file.
+    cluster_count = _uint_property("cluster_count", "The number of clusters in this archive.")
+    """
+    The number of clusters in this archive.
 
-        @param value: value to set
-        @type value: L{int}
-        @raises TypeError: if value is not an integer
-        @raises pyzim.exceptions.NonMutable: if this header is set to be inmutable.
-        @raises ValueError: if the value is invalid (e.g. negative).
-        """
-        if not isinstance(value, int):
-            raise TypeError("Expected int, got {}".format(type(value)))
-        if value < 0:
-            raise ValueError("Value can not be negative!")
-        self.ensure_mutable()
-        if value != self._major_version:
-            self._major_version = value
-            self.mark_dirty()
+    @raises TypeError: on set, if value is not an integer
+    @raises ValueError: on set, if the value is invalid (e.g. negative)
+    @raises pyzim.exceptions.NonMutable: on set, if this header is set to be inmutable.
+    @type: L{int}
+    """
+
+    url_pointer_position = _uint_property("url_pointer_position", "The offset to the directory pointer list ordered by URL.")
+    """
+    The offset to the directory pointer list ordered by URL.
+
+    @raises TypeError: on set, if value is not an integer
+    @raises ValueError: on set, if the value is invalid (e.g. negative)
+    @raises pyzim.exceptions.NonMutable: on set, if this header is set to be inmutable.
+    @type: L{int}
+    """
+
+    title_pointer_position = _uint_property("title_pointer_position", "The offset to the directory pointer list ordered by title.")
+    """
+    The offset to the directory pointer list ordered by title.
+
+    @raises TypeError: on set, if value is not an integer
+    @raises ValueError: on set, if the value is invalid (e.g. negative)
+    @raises pyzim.exceptions.NonMutable: on set, if this header is set to be inmutable.
+    @type: L{int}
+    """
+
+    cluster_pointer_position = _uint_property("cluster_pointer_position", "The offset to the cluster pointer list.")
+    """
+    The offset to the cluster pointer list.
+
+    @raises TypeError: on set, if value is not an integer
+    @raises ValueError: on set, if the value is invalid (e.g. negative)
+    @raises pyzim.exceptions.NonMutable: on set, if this header is set to be inmutable.
+    @type: L{int}
+    """
+
+    mime_list_position = _uint_property("mime_list_position", "The offset to the mime type list.")
+    """
+    The offset to the mime type list.
+
+    @raises TypeError: on set, if value is not an integer
+    @raises ValueError: on set, if the value is invalid (e.g. negative)
+    @raises pyzim.exceptions.NonMutable: on set, if this header is set to be inmutable.
+    @type: L{int}
+    """
+
+    checksum_position = _uint_property("checksum_position", "The offset to the checksum.")
+    """
+    The offset to the checksum.
+
+    @raises TypeError: on set, if value is not an integer
+    @raises ValueError: on set, if the value is invalid (e.g. negative)
+    @raises pyzim.exceptions.NonMutable: on set, if this header is set to be inmutable.
+    @type: L{int}
+    """
 
     @property
-    def minor_version(self):
+    def magic_number(self):
         """
-        The minor version of this ZIM file.
+        The magic number of this ZIM file.
 
-        @return: the minor version of this ZIM file.
+        @return: the magic number of this ZIM file.
         @rtype: L{int}
         """
-        return self._minor_version
+        return self._magic_number
 
-    @minor_version.setter
-    def minor_version(self, value):
+    @magic_number.setter
+    def magic_number(self, value):
         """
-        The minor version of this ZIM file.
+        The magic number of this ZIM file.
 
         @param value: value to set
         @type value: L{int}
         @raises TypeError: if value is not an integer
         @raises pyzim.exceptions.NonMutable: if this header is set to be inmutable.
-        @raises ValueError: if the value is invalid (e.g. negative).
         """
+        if (value == self._magic_number) and isinstance(value, int):
+            # unchanged, nothing to do
+            return
         if not isinstance(value, int):
             raise TypeError("Expected int, got {}".format(type(value)))
-        if value < 0:
-            raise ValueError("Value can not be negative!")
         self.ensure_mutable()
-        if value != self._minor_version:
-            self._minor_version = value
-            self.mark_dirty()
+        self._magic_number = value
+        self.mark_dirty()
 
     @property
     def uuid(self):
@@ -345,6 +456,8 @@ Pages:
         @return: the UUID of this ZIM file.
         @rtype: L{uuid.UUID}
         """
+        if self._uuid is None:
+            self._uuid = pyuuid.UUID(bytes_le=self._raw_uuid)
         return self._uuid
 
     @uuid.setter
@@ -366,188 +479,9 @@ Pages:
         else:
             raise TypeError("uuid must be either bytes, int or a uuid.UUID, not {!r}!".format(type(value)))
         self.ensure_mutable()
-        if converted != self._uuid:
+        if converted != self.uuid:
             self._uuid = converted
-            self.mark_dirty()
-
-    @property
-    def entry_count(self):
-        """
-        The number of entries in this archive.
-
-        @return: The number of entries in this archive.
-        @rtype: L{int}
-        """
-        return self._entry_count
-
-    @entry_count.setter
-    def entry_count(self, value):
-        """
-        The number of entries in this archive.
-
-        @param value: value to set
-        @type value: L{int}
-        @raises TypeError: if value is not an integer
-        @raises pyzim.exceptions.NonMutable: if this header is set to be inmutable.
-        @raises ValueError: if the value is invalid (e.g. negative)
-        """
-        if not isinstance(value, int):
-            raise TypeError("Expected int, got {}".format(type(value)))
-        if value < 0:
-            raise ValueError("Value can not be negative!")
-        self.ensure_mutable()
-        if value != self._entry_count:
-            self._entry_count = value
-            self.mark_dirty()
-
-    @property
-    def cluster_count(self):
-        """
-        The number of clusters in this archive.
-
-        @return: The number of clusters in this archive.
-        @rtype: L{int}
-        """
-        return self._cluster_count
-
-    @cluster_count.setter
-    def cluster_count(self, value):
-        """
-        The number of clusters in this archive.
-
-        @param value: value to set
-        @type value: L{int}
-        @raises TypeError: if value is not an integer
-        @raises pyzim.exceptions.NonMutable: if this header is set to be inmutable.
-        @raises ValueError: if the value is invalid (e.g. negative)
-        """
-        if not isinstance(value, int):
-            raise TypeError("Expected int, got {}".format(type(value)))
-        if value < 0:
-            raise ValueError("Value can not be negative!")
-        self.ensure_mutable()
-        if value != self._cluster_count:
-            self._cluster_count = value
-            self.mark_dirty()
-
-    @property
-    def url_pointer_position(self):
-        """
-        The offset to the directory pointer list ordered by URL.
-
-        @return: The offset to the directory pointer list ordered by URL.
-        @rtype: L{int}
-        """
-        return self._url_pointer_position
-
-    @url_pointer_position.setter
-    def url_pointer_position(self, value):
-        """
-        The offset to the directory pointer list ordered by URL.
-
-        @param value: value to set
-        @type value: L{int}
-        @raises TypeError: if value is not an integer
-        @raises pyzim.exceptions.NonMutable: if this header is set to be inmutable.
-        @raises ValueError: if the value is invalid (e.g. negative)
-        """
-        if not isinstance(value, int):
-            raise TypeError("Expected int, got {}".format(type(value)))
-        if value < 0:
-            raise ValueError("Value can not be negative!")
-        self.ensure_mutable()
-        if value != self._url_pointer_position:
-            self._url_pointer_position = value
-            self.mark_dirty()
-
-    @property
-    def title_pointer_position(self):
-        """
-        The offset to the directory pointer list ordered by title.
-
-        @return: The offset to the directory pointer list ordered by title.
-        @rtype: L{int}
-        """
-        return self._title_pointer_position
-
-    @title_pointer_position.setter
-    def title_pointer_position(self, value):
-        """
-        The offset to the directory pointer list ordered by title.
-
-        @param value: value to set
-        @type value: L{int}
-        @raises TypeError: if value is not an integer
-        @raises pyzim.exceptions.NonMutable: if this header is set to be inmutable.
-        @raises ValueError: if the value is invalid (e.g. negative)
-        """
-        if not isinstance(value, int):
-            raise TypeError("Expected int, got {}".format(type(value)))
-        if value < 0:
-            raise ValueError("Value can not be negative!")
-        self.ensure_mutable()
-        if value != self._title_pointer_position:
-            self._title_pointer_position = value
-            self.mark_dirty()
-
-    @property
-    def cluster_pointer_position(self):
-        """
-        The offset to the cluster pointer list.
-
-        @return: The offset to the cluster pointer list.
-        @rtype: L{int}
-        """
-        return self._cluster_pointer_position
-
-    @cluster_pointer_position.setter
-    def cluster_pointer_position(self, value):
-        """
-        The offset to the cluster pointer list.
-
-        @param value: value to set
-        @type value: L{int}
-        @raises TypeError: if value is not an integer
-        @raises pyzim.exceptions.NonMutable: if this header is set to be inmutable.
-        @raises ValueError: if the value is invalid (e.g. negative)
-        """
-        if not isinstance(value, int):
-            raise TypeError("Expected int, got {}".format(type(value)))
-        if value < 0:
-            raise ValueError("Value can not be negative!")
-        self.ensure_mutable()
-        if value != self._cluster_pointer_position:
-            self._cluster_pointer_position = value
-            self.mark_dirty()
-
-    @property
-    def mime_list_position(self):
-        """
-        The offset to the mime type list.
-
-        @return: The offset to the mime type list.
-        @rtype: L{int}
-        """
-        return self._mime_list_position
-
-    @mime_list_position.setter
-    def mime_list_position(self, value):
-        """
-        The offset to the mime type list.
-
-        @param value: value to set
-        @type value: L{int}
-        @raises TypeError: if value is not an integer
-        @raises pyzim.exceptions.NonMutable: if this header is set to be inmutable.
-        @raises ValueError: if the value is invalid (e.g. negative)
-        """
-        if not isinstance(value, int):
-            raise TypeError("Expected int, got {}".format(type(value)))
-        if value < 0:
-            raise ValueError("Value can not be negative!")
-        self.ensure_mutable()
-        if value != self._mime_list_position:
-            self._mime_list_position = value
+            self._raw_uuid = None
             self.mark_dirty()
 
     @property
@@ -573,6 +507,13 @@ Pages:
         @raises pyzim.exceptions.NonMutable: if this header is set to be inmutable.
         @raises ValueError: if the value is invalid (e.g. negative)
         """
+        if value is None:
+            if self._main_page == 0xffffffff:
+                # unchanged, nothing to do
+                return
+        elif (value == self._main_page) and isinstance(value, int):
+            # unchanged, nothing to do
+            return
         if not isinstance(value, int) and (value is not None):
             raise TypeError("Expected int or None, got {}".format(type(value)))
         if (value is not None) and (value < 0):
@@ -580,9 +521,8 @@ Pages:
         self.ensure_mutable()
         if value is None:
             value = 0xffffffff
-        if value != self._main_page:
-            self._main_page = value
-            self.mark_dirty()
+        self._main_page = value
+        self.mark_dirty()
 
     @property
     def has_main_page(self):
@@ -592,7 +532,7 @@ Pages:
         @return: True if the mainPage pointer is set, False otherwise
         @rtype: L{bool}
         """
-        return self.main_page is not None
+        return self._main_page != 0xffffffff
 
     @property
     def layout_page(self):
@@ -617,6 +557,13 @@ Pages:
         @raises pyzim.exceptions.NonMutable: if this header is set to be inmutable.
         @raises ValueError: if the value is invalid (e.g. negative)
         """
+        if value is None:
+            if self._layout_page == 0xffffffff:
+                # unchanged, nothing to do
+                return
+        elif (value == self._layout_page) and isinstance(value, int):
+            # unchanged, nothing to do
+            return
         if not isinstance(value, int) and (value is not None):
             raise TypeError("Expected int or None, got {}".format(type(value)))
         if (value is not None) and (value < 0):
@@ -624,9 +571,8 @@ Pages:
         self.ensure_mutable()
         if value is None:
             value = 0xffffffff
-        if value != self._layout_page:
-            self._layout_page = value
-            self.mark_dirty()
+        self._layout_page = value
+        self.mark_dirty()
 
     @property
     def has_layout_page(self):
@@ -636,37 +582,7 @@ Pages:
         @return: True if the layoutPage pointer is set, False otherwise
         @rtype: L{bool}
         """
-        return self.layout_page is not None
-
-    @property
-    def checksum_position(self):
-        """
-        The offset to the checksum.
-
-        @return: The offset to the checksum.
-        @rtype: L{int}
-        """
-        return self._checksum_position
-
-    @checksum_position.setter
-    def checksum_position(self, value):
-        """
-        The offset to the checksum.
-
-        @param value: value to set
-        @type value: L{int}
-        @raises TypeError: if value is not an integer
-        @raises pyzim.exceptions.NonMutable: if this header is set to be inmutable.
-        @raises ValueError: if the value is invalid (e.g. negative)
-        """
-        if not isinstance(value, int):
-            raise TypeError("Expected int, got {}".format(type(value)))
-        if value < 0:
-            raise ValueError("Value can not be negative!")
-        self.ensure_mutable()
-        if value != self._checksum_position:
-            self._checksum_position = value
-            self.mark_dirty()
+        return self._layout_page != 0xffffffff
 
     # ================ converters =====================
 
@@ -684,7 +600,7 @@ Pages:
         if len(s) != cls.LENGTH:
             # invalid header length
             raise ValueError("Header length must be {}, got {}!".format(cls.LENGTH, len(s)))
-        values = struct.unpack(cls.FORMAT, s)
+        values = cls.STRUCT.unpack(s)
         header = cls(*values)
         return header
 
@@ -706,19 +622,26 @@ Pages:
         data = f.read(cls.LENGTH)
         return cls.from_bytes(data)
 
-    def to_bytes(self):
+    def to_bytes(self, buf=None, offset=0):
         """
         Dump this header into a bytestring.
 
-        @return: a bytestring representation of this header.
-        @rtype: L{bytes}
+        If a buffer is specified, the header will be written directly
+        into this buffer instead of creating a new bytestring.
+
+        @param buf: if specified, a writable buffer to dump this header into
+        @type buf: L{bytearray} or L{memoryview} or L{None}
+        @param offset: offset in buf at which the header should be written
+        @type offset: L{int}
+        @return: a bytestring representation of this header or buf if specified.
+        @rtype: L{bytes} or the type of buf
         """
-        packed = struct.pack(
-            self.FORMAT,  # format to dump as
+        assert isinstance(offset, int) and offset >= 0
+        values = (
             self._magic_number,
             self._major_version,
             self._minor_version,
-            self._uuid.bytes_le,
+            (self._raw_uuid if self._uuid is None else self._uuid.bytes_le),
             self._entry_count,
             self._cluster_count,
             self._url_pointer_position,
@@ -729,7 +652,10 @@ Pages:
             self._layout_page,
             self._checksum_position,
         )
-        return packed
+        if buf is None:
+            return self.STRUCT.pack(*values)
+        self.STRUCT.pack_into(buf, offset, *values)
+        return buf
 
     def to_dict(self):
         """
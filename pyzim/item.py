@@ -4,6 +4,8 @@ This module contains the L{Item} class, which is a helper for easily adding entr
 This behavior is inspired by the original libzim. Using items is
 optional, but definitely helpful.
 """
+import sys
+
 from pyzim import constants
 from pyzim.blob import BaseBlobSource, EntryBlobSource
 from pyzim.entry import ContentEntry
@@ -36,6 +38,17 @@ class Item(object):
     @ivar _is_article: if nonzero, entry should be an article
     @type _is_article: L{bool}
     """
+
+    # there may be a lot of items alive at once, use __slots__ to reduce their memory footprint
+    __slots__ = (
+        "_namespace",
+        "_url",
+        "_mimetype",
+        "_title",
+        "_blob_source",
+        "_is_article",
+    )
+
     def __init__(
         self,
         namespace,
@@ -96,10 +109,8 @@ class Item(object):
         """
         if not (isinstance(value, str) or value is None):
             raise TypeError("Title must be string or None, got {} instead!".format(type(value)))
-        if value is not None:
-            encoded_title = value.encode(constants.ENCODING)
-            if b"\x00" in encoded_title:
-                raise ValueError("Title can not contain a null byte!")
+        if (value is not None) and ("\x00" in value):
+            raise ValueError("Title can not contain a null byte!")
         self._title = value
 
     @property
@@ -126,8 +137,7 @@ class Item(object):
             raise TypeError("URL must be a string, got {} instead!".format(type(value)))
         elif len(value) == 0:
             raise ValueError("URL can not be empty!")
-        encoded = value.encode(constants.ENCODING)
-        if b"\x00" in encoded:
+        elif "\x00" in value:
             raise ValueError("URL can not contain a null byte!")
         self._url = value
 
@@ -155,7 +165,8 @@ class Item(object):
             raise TypeError("Namespace must be a string, got {} instead!".format(type(value)))
         elif len(value.encode(constants.ENCODING)) != 1:
             raise ValueError("Namespace must be a string of length 1!")
-        self._namespace = value
+        # there are only few distinct namespaces, share the string objects
+        self._namespace = sys.intern(value)
 
     @property
     def mimetype(self):
@@ -181,10 +192,10 @@ class Item(object):
             raise TypeError("Mimetype must be a string, got {} instead!".format(type(value)))
         elif len(value) == 0:
             raise ValueError("Mimetype can not be empty!")
-        encoded = value.encode(constants.ENCODING)
-        if b"\x00" in encoded:
+        elif "\x00" in value:
             raise ValueError("Mimetype can not contain a null byte!")
-        self._mimetype = value
+        # many items share the same mimetype, share the string objects
+        self._mimetype = sys.intern(value)
 
     @property
     def blob_source(self):
@@ -4,8 +4,7 @@ Implementation of the MIME type list.
 import threading
 
 from . import constants
-from .modifiable import ModifiableMixIn
-from .util.ioutil import read_until_zero
+from .modifiable import ModifiableMixIn, cached_disk_size
 
 
 class MimeTypeList(ModifiableMixIn):
@@ -19,8 +18,14 @@ class MimeTypeList(ModifiableMixIn):
 
     @ivar _mimetypes: (ordered) list of mimetypes in this object
     @type _mimetypes: L{list} of L{bytes}
+    @ivar _decoded_mimetypes: the decoded mimetypes, in the same order as L{MimeTypeList._mimetypes}, L{None} if not yet decoded
+    @type _decoded_mimetypes: L{list} of L{str} or L{None}
+    @ivar _index: a mimetype -> index mapping of the mimetypes in this object
+    @type _index: L{dict} of L{bytes} -> L{int}
     @ivar _lock: thread safety lock
     @type _lock: L{threading.Lock}
+    @ivar _cached_bytes: cached result of L{MimeTypeList.to_bytes}, None if not yet computed
+    @type _cached_bytes: L{bytes} or L{None}
     """
     def __init__(self, mimetypes):
         """
@@ -32,7 +37,13 @@ class MimeTypeList(ModifiableMixIn):
         assert isinstance(mimetypes, list)
         ModifiableMixIn.__init__(self)
         self._mimetypes = mimetypes
+        self._decoded_mimetypes = [None] * len(mimetypes)
+        self._index = {}
+        for i, mimetype in enumerate(mimetypes):
+            # keep the first index in case of duplicates
+            self._index.setdefault(mimetype, i)
         self._lock = threading.Lock()
+        self._cached_bytes = None
 
         # ensure we know the current object size before modifications later
         self.after_flush_or_read()
@@ -57,28 +68,64 @@ class MimeTypeList(ModifiableMixIn):
         return "\n".join(mimetypestrings) + "\n"
 
     @classmethod
-    def from_file(cls, f, seek=None):
+    def from_file(cls, f, seek=None, buffersize=4096):
         """
         Read the mime type list from a file.
 
+        The mimetype list is read in blocks of the specified size, so the
+        file position afterwards may be after the end of the mimetype list.
+
         @param f: file-like object to read from
         @type f: file-like
         @param seek: if specified, seek this position
         @type seek: L{int} or L{None}
+        @param buffersize: size of the blocks to read
+        @type buffersize: L{int}
         @return: the mimetypelist read from the file
         @rtype: L{pyzim.mimetypelist.MimeTypeList}
         """
         assert isinstance(seek, int) or seek is None
+        assert isinstance(buffersize, int) and buffersize > 0
         if seek is not None:
             f.seek(seek)
-        mimetypes = []
+        data = b""
         while True:
-            mimetype = read_until_zero(f)
-            if not mimetype:
-                # end of mimetype list
+            block = f.read(buffersize)
+            # we only need to search the new block and the last byte of the old data
+            search_start = max(len(data) - 1, 0)
+            data += block
+            if data.startswith(b"\x00"):
+                # empty mimetype list
+                end = 0
+                break
+            end = data.find(b"\x00\x00", search_start)
+            if end >= 0:
+                # +1 to include the terminating zero of the last mimetype
+                end += 1
                 break
-            mimetypes.append(mimetype)
-        return cls(mimetypes)
+            if not block:
+                raise IOError("Encountered EOF before end of mimetype list!")
+        return cls.from_bytes(data[:end + 1])
+
+    @classmethod
+    def from_bytes(cls, s):
+        """
+        Parse the mime type list from a bytestring.
+
+        @param s: bytestring containing the mimetype list, including the end byte
+        @type s: L{bytes}
+        @return: the parsed mimetypelist
+        @rtype: L{pyzim.mimetypelist.MimeTypeList}
+        @raises ValueError: if the end of the mimetype list is missing
+        """
+        assert isinstance(s, bytes)
+        if s.startswith(b"\x00"):
+            # empty mimetype list
+            return cls([])
+        end = s.find(b"\x00\x00")
+        if end < 0:
+            raise ValueError("Mimetype list is not terminated!")
+        return cls(s[:end].split(b"\x00"))
 
     def to_bytes(self):
         """
@@ -87,7 +134,27 @@ class MimeTypeList(ModifiableMixIn):
         @return: a bytestring containing this mimetypelist.
         @rtype: L{bytes}
         """
-        return b"\x00".join(self._mimetypes) + b"\x00\x00"  # twice to indicate end of mimetype list
+        if self._cached_bytes is None:
+            if not self._mimetypes:
+                # only the terminating empty mimetype
+                self._cached_bytes = b"\x00"
+            else:
+                self._cached_bytes = b"\x00".join(self._mimetypes) + b"\x00\x00"  # twice to indicate end of mimetype list
+        return self._cached_bytes
+
+    @staticmethod
+    def _as_bytes(mimetype):
+        """
+        Return the mimetype as bytes, encoding it if necessary.
+
+        @param mimetype: mimetype to convert
+        @type mimetype: L{bytes} or L{str}
+        @return: the mimetype as bytes
+        @rtype: L{bytes}
+        """
+        if isinstance(mimetype, str):
+            return mimetype.encode(constants.ENCODING)
+        return mimetype
 
     def get(self, i, as_unicode=False):
         """
@@ -108,10 +175,13 @@ class MimeTypeList(ModifiableMixIn):
                     len(self._mimetypes),
                 ),
             )
-        mimetype = self._mimetypes[i]
         if as_unicode:
-            return mimetype.decode(constants.ENCODING)
-        return mimetype
+            # entries only refer to a few distinct mimetypes, so decode each only once
+            mimetype = self._decoded_mimetypes[i]
+            if mimetype is None:
+                mimetype = self._decoded_mimetypes[i] = self._mimetypes[i].decode(constants.ENCODING)
+            return mimetype
+        return self._mimetypes[i]
 
     def has(self, mimetype):
         """
@@ -123,9 +193,8 @@ class MimeTypeList(ModifiableMixIn):
         @rtype: L{bool}
         """
         assert isinstance(mimetype, (bytes, str))
-        if isinstance(mimetype, str):
-            mimetype = mimetype.encode(constants.ENCODING)
-        return mimetype in self._mimetypes
+        mimetype = self._as_bytes(mimetype)
+        return mimetype in self._index
 
     def get_index(self, mimetype, register=False):
         """
@@ -139,15 +208,13 @@ class MimeTypeList(ModifiableMixIn):
         @rtype: L{int} or L{None} if not found and register is not true
         """
         assert isinstance(mimetype, (bytes, str))
-        if isinstance(mimetype, str):
-            mimetype = mimetype.encode(constants.ENCODING)
-        for i, element in enumerate(self._mimetypes):
-            if element == mimetype:
-                return i
+        mimetype = self._as_bytes(mimetype)
+        index = self._index.get(mimetype, None)
+        if index is not None:
+            return index
         if register:
             self.register(mimetype)
-            # recursively get new index
-            return self.get_index(mimetype, register=False)
+            return self._index[mimetype]
         else:
             return None
 
@@ -164,17 +231,19 @@ class MimeTypeList(ModifiableMixIn):
         """
         assert isinstance(mimetype, (bytes, str))
         self.ensure_mutable()
-        if isinstance(mimetype, str):
-            mimetype = mimetype.encode(constants.ENCODING)
+        mimetype = self._as_bytes(mimetype)
         with self._lock:
             # first, check if we don't already have this mimetype registered
             # we do this even if this check has already been performed before
             # this way, we can ensure that multiple threads can not add the
             # same mime type twice
-            if self.has(mimetype):
+            if mimetype in self._index:
                 return
 
+            self._index[mimetype] = len(self._mimetypes)
             self._mimetypes.append(mimetype)
+            self._decoded_mimetypes.append(None)
+            self._cached_bytes = None
             self.mark_dirty()
 
     def iter_mimetypes(self, as_unicode=False):
@@ -191,11 +260,10 @@ class MimeTypeList(ModifiableMixIn):
                 mimetype = mimetype.decode(constants.ENCODING)
             yield mimetype
 
+    @cached_disk_size
     def get_disk_size(self):
-        size = 1  # for end byte
-        for mt in self._mimetypes:
-            size += (len(mt) + 1)
-        return size
+        # +1 per mimetype for the separator, +1 for the end byte
+        return sum(len(mt) + 1 for mt in self._mimetypes) + 1
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -3,9 +3,32 @@ Mix-in for modifiable objects in an archive.
 
 This module contains the logic to manage "dirty"/modified states of objects.
 """
+import functools
+
 from .exceptions import NonMutable
 
 
+def cached_disk_size(f):
+    """
+    Decorator for caching the result of L{ModifiableMixIn.get_disk_size}.
+
+    The cached size will be discarded whenever the object is marked as
+    dirty. Only use this for objects where calculating the size is
+    expensive and each modification marks the object as dirty.
+
+    @param f: get_disk_size() method to decorate
+    @type f: L{callable}
+    @return: the decorated method
+    @rtype: L{callable}
+    """
+    @functools.wraps(f)
+    def wrapper(self):
+        if self._cached_disk_size is None:
+            self._cached_disk_size = f(self)
+        return self._cached_disk_size
+    return wrapper
+
+
 class ModifiableMixIn(object):
     """
     A mix-in class for modifiable objects.
@@ -25,11 +48,31 @@ class ModifiableMixIn(object):
 
     @ivar _dirty: a boolean flag that's nonzero if this object has been modified
     @type _dirty: L{bool}
-    @ivar _submodifiables: a list of child objects, whose dirty state will affect this objects dirty state.
-    @type _submodifiables: L{list} of L{ModifiableMixIn}
+    @ivar _dirty_children: the children that are currently dirty
+    @type _dirty_children: L{set} of L{ModifiableMixIn}
+    @ivar _submodifiables: a dict mapping the ids of child objects to said objects, whose dirty state will affect this objects dirty state.
+    @type _submodifiables: L{dict} of L{int} -> L{ModifiableMixIn}
+    @ivar _parents: the objects this object has been added to as a child
+    @type _parents: L{set} of L{ModifiableMixIn}
     @ivar _old_disk_size: the size of this object on disk before any modifications since the last flush/read
     @type _old_disk_size: L{int} or L{None}
+    @ivar _cached_disk_size: the cached disk size, see L{cached_disk_size}
+    @type _cached_disk_size: L{int} or L{None}
     """
+
+    # there may be a lot of modifiable objects (e.g. entries) alive at once
+    # keeping the attributes in slots makes accessing the dirty state
+    # slightly faster and reduces the size of the instance dicts of subclasses
+    __slots__ = (
+        "_dirty",
+        "_dirty_children",
+        "_submodifiables",
+        "_parents",
+        "_old_disk_size",
+        "_cached_disk_size",
+        "mutable",
+    )
+
     def __init__(self):
         """
         The default constructor.
@@ -37,8 +80,11 @@ class ModifiableMixIn(object):
         Don't forget to call this constructor in subclasses!
         """
         self._dirty = False
-        self._submodifiables = []
+        self._dirty_children = set()
+        self._submodifiables = {}
+        self._parents = set()
         self._old_disk_size = None
+        self._cached_disk_size = None
         self.mutable = True
 
     @property
@@ -49,7 +95,7 @@ class ModifiableMixIn(object):
         @return: True if this object or a child has been modified
         @rtype: L{bool}
         """
-        return self._dirty or any([sm.dirty for sm in self._submodifiables])
+        return self._dirty or bool(self._dirty_children)
 
     @dirty.setter
     def dirty(self, value):
@@ -59,7 +105,12 @@ class ModifiableMixIn(object):
         @param value: new value to set
         @type value: L{bool}
         """
+        if value:
+            self._cached_disk_size = None
+        was_dirty = self.dirty
         self._dirty = value
+        if self.dirty != was_dirty:
+            self._notify_parents()
 
     def mark_dirty(self):
         """
@@ -67,7 +118,37 @@ class ModifiableMixIn(object):
 
         You can also simply set L{ModifiableMixIn.dirty} to C{True}.
         """
-        self._dirty = True
+        self._cached_disk_size = None
+        if not self._dirty:
+            self.dirty = True
+
+    def _notify_parents(self):
+        """
+        Inform all parents that the dirty state of this object has changed.
+        """
+        is_dirty = self.dirty
+        for parent in self._parents:
+            parent._set_child_dirty(self, is_dirty)
+
+    def _set_child_dirty(self, child, is_dirty):
+        """
+        Update the dirty state of a child in L{ModifiableMixIn._dirty_children}.
+
+        If this changes the dirty state of this object, the parents are
+        informed as well. Otherwise, propagation stops here.
+
+        @param child: child whose dirty state changed
+        @type child: L{ModifiableMixIn}
+        @param is_dirty: whether the child is now dirty or not
+        @type is_dirty: L{bool}
+        """
+        was_dirty = self.dirty
+        if is_dirty:
+            self._dirty_children.add(child)
+        else:
+            self._dirty_children.discard(child)
+        if self.dirty != was_dirty:
+            self._notify_parents()
 
     def add_submodifiable(self, child):
         """
@@ -79,8 +160,11 @@ class ModifiableMixIn(object):
         """
         if not isinstance(child, ModifiableMixIn):
             raise TypeError("Expected an instance of ModifiableMixIn, not {}!".format(type(child)))
-        if child not in self._submodifiables:
-            self._submodifiables.append(child)
+        if id(child) not in self._submodifiables:
+            self._submodifiables[id(child)] = child
+            child._parents.add(self)
+            if child.dirty:
+                self._set_child_dirty(child, True)
 
     def remove_submodifiable(self, child):
         """
@@ -93,9 +177,10 @@ class ModifiableMixIn(object):
         """
         if not isinstance(child, ModifiableMixIn):
             raise TypeError("Expected an instance of ModifiableMixIn, not {}!".format(type(child)))
-        if child not in self._submodifiables:
+        if self._submodifiables.pop(id(child), None) is None:
             raise ValueError("Object {} not registered as a child of this object!".format(child))
-        self._submodifiables.remove(child)
+        child._parents.discard(self)
+        self._set_child_dirty(child, False)
 
     def after_flush_or_read(self):
         """
@@ -1,7 +1,13 @@
 """
 Implementation of URL and title pointer lists.
 """
+import array
+import bisect
+import functools
+import itertools
+import operator
 import struct
+import sys
 import threading
 
 from . import constants, exceptions
@@ -10,6 +16,38 @@ from .modifiable import ModifiableMixIn
 
 # ============ HELPER FUNCTIONS =============
 
+class _KeyedSequence(object):
+    """
+    A read-only view of a sequence that applies a key function to each element.
+
+    This allows using L{bisect} on sequences with a key function on
+    python versions not supporting the key parameter of L{bisect}.
+    The key function is only called for the elements actually accessed.
+
+    @ivar _sequence: the sequence to wrap
+    @type _sequence: an indexable object
+    @ivar _key: the key function
+    @type _key: callable expecting one argument
+    """
+    def __init__(self, sequence, key):
+        """
+        The default constructor.
+
+        @param sequence: the sequence to wrap
+        @type sequence: an indexable object
+        @param key: the key function
+        @type key: callable expecting one argument
+        """
+        self._sequence = sequence
+        self._key = key
+
+    def __len__(self):
+        return len(self._sequence)
+
+    def __getitem__(self, i):
+        return self._key(self._sequence[i])
+
+
 def binarysearch(to_search, element, key, start=0, end=None):
     """
     Adapted version of the binarysearch algorithm.
@@ -21,30 +59,167 @@ def binarysearch(to_search, element, key, start=0, end=None):
     @type element: any
     @param key: key function to extract comparison key. Not applied to element.
     @type key: callable expecting one argument
-    @param start: start of search range. Used for recursive call.
+    @param start: start of search range
     @type start: L{int}
-    @param end: end of search range. Used for recursive call.
+    @param end: end of search range
     @type end: L{int}
     @return: the first index for which all subsequent elements are >= the specified element
     @rtype: L{int}
     """
     assert hasattr(to_search, "__getitem__")
     assert isinstance(start, int) and start >= 0 and start <= len(to_search)
-    assert (isinstance(end, int) and end >= 0 and end <= len(end)) or (end is None)
+    assert (isinstance(end, int) and end >= 0 and end <= len(to_search)) or (end is None)
     assert (end is None) or (start <= end)
     if end is None:
         end = len(to_search)
-    if end - start == 0:
-        # only insertion point is at start
-        return start
-
-    while start < end:
-        mid = (start + end) // 2
-        if key(to_search[mid]) < element:
-            start = mid + 1
-        else:
-            end = mid
-    return start
+    return bisect.bisect_left(_KeyedSequence(to_search, key), element, start, end)
+
+
+@functools.lru_cache(maxsize=None)
+def get_pointer_struct(pointer_format):
+    """
+    Return a precompiled struct for a single pointer of the specified format.
+
+    The structs are cached, so each format is only compiled once.
+
+    @param pointer_format: the struct format of a single pointer (without endian)
+    @type pointer_format: L{str}
+    @return: the struct for a single pointer
+    @rtype: L{struct.Struct}
+    """
+    return struct.Struct(constants.ENDIAN + pointer_format)
+
+
+@functools.lru_cache(maxsize=64)
+def get_bulk_pointer_struct(pointer_format, n):
+    """
+    Return a precompiled struct for n consecutive pointers of the specified format.
+
+    This is used when the pointers can not be stored in an L{array.array},
+    allowing a whole pointer list to be (un-)packed with a single call.
+
+    @param pointer_format: the struct format of a single pointer (without endian)
+    @type pointer_format: L{str}
+    @param n: number of pointers
+    @type n: L{int}
+    @return: the struct for n pointers
+    @rtype: L{struct.Struct}
+    """
+    return struct.Struct(constants.ENDIAN + pointer_format * n)
+
+
+@functools.lru_cache(maxsize=None)
+def get_array_typecode(pointer_format):
+    """
+    Find the L{array.array} typecode matching the specified pointer format.
+
+    @param pointer_format: the struct format of a single pointer (without endian)
+    @type pointer_format: L{str}
+    @return: an unsigned typecode with the same item size or L{None} if none matches
+    @rtype: L{str} or L{None}
+    """
+    size = get_pointer_struct(pointer_format).size
+    for typecode in ("B", "H", "I", "L", "Q"):
+        if array.array(typecode).itemsize == size:
+            return typecode
+    return None
+
+
+def needs_byteswap():
+    """
+    Check if the byteorder of this machine differs from the byteorder of ZIM files.
+
+    @return: True if values read into an array need to be byteswapped
+    @rtype: L{bool}
+    """
+    if constants.ENDIAN in ("<", ">"):
+        return (constants.ENDIAN == "<") != (sys.byteorder == "little")
+    # native byteorder
+    return False
+
+
+def new_pointer_array(pointer_format, pointers=()):
+    """
+    Create a new container for storing pointers of the specified format.
+
+    If possible, this is an L{array.array} with a matching typecode,
+    which stores the pointers far more compact than a L{list}.
+
+    @param pointer_format: the struct format of a single pointer (without endian)
+    @type pointer_format: L{str}
+    @param pointers: initial pointers
+    @type pointers: iterable of L{int}
+    @return: the container for the pointers
+    @rtype: L{array.array} or L{list} if no typecode matches
+    """
+    typecode = get_array_typecode(pointer_format)
+    if typecode is None:
+        return list(pointers)
+    return array.array(typecode, pointers)
+
+
+def read_pointers(f, n, pointer_format):
+    """
+    Read n pointers of the specified format from a file.
+
+    If possible, the pointers are read directly into an L{array.array}
+    using C{f.readinto()}, avoiding intermediate copies and unpacking
+    each pointer individually.
+
+    @param f: file-like object to read from
+    @type f: file-like
+    @param n: number of pointers to read
+    @type n: L{int}
+    @param pointer_format: the struct format of a single pointer (without endian)
+    @type pointer_format: L{str}
+    @return: the pointers read
+    @rtype: L{array.array} or L{list}, see L{new_pointer_array}
+    @raises IOError: when encountering EOF before reading all pointers
+    """
+    assert isinstance(n, int) and n >= 0
+    pointer_struct = get_pointer_struct(pointer_format)
+    total_size = n * pointer_struct.size
+    typecode = get_array_typecode(pointer_format)
+    if not hasattr(f, "readinto"):
+        # fallback
+        data = f.read(total_size)
+        if len(data) != total_size:
+            raise IOError("Encountered EOF before reading full {} bytes ({} read)!".format(total_size, len(data)))
+        if typecode is None:
+            return list(get_bulk_pointer_struct(pointer_format, n).unpack(data))
+        pointers = array.array(typecode)
+        pointers.frombytes(data)
+    elif typecode is None:
+        data = bytearray(total_size)
+        _readinto_fully(f, data)
+        return [v[0] for v in pointer_struct.iter_unpack(data)]
+    else:
+        pointers = array.array(typecode, [0]) * n
+        _readinto_fully(f, pointers)
+    if needs_byteswap():
+        pointers.byteswap()
+    return pointers
+
+
+def _readinto_fully(f, buffer):
+    """
+    Fill a writable buffer with data read from a file using C{f.readinto()}.
+
+    @param f: file-like object to read from
+    @type f: file-like
+    @param buffer: buffer to fill
+    @type buffer: a writable object supporting the buffer protocol
+    @raises IOError: when encountering EOF before the buffer has been filled
+    """
+    with memoryview(buffer) as view, view.cast("B") as byteview:
+        total_size = len(byteview)
+        read = 0
+        while read < total_size:
+            with byteview[read:] as remaining:
+                n_read = f.readinto(remaining)
+            if not n_read:
+                raise IOError("Encountered EOF before reading full {} bytes ({} read)!".format(total_size, read))
+            read += n_read
 
 
 # ============ BASE POINTER LISTS =============
@@ -59,8 +234,14 @@ class SimplePointerList(ModifiableMixIn):
     @cvar POINTER_FORMAT: format of a single pointer
     @type POINTER_FORMAT: L{str}
 
-    @ivar _pointers: list of pointers in this pointer list
-    @type _pointers: L{list} of L{int}
+    @ivar _pointers: pointers in this pointer list, see L{new_pointer_array}
+    @type _pointers: L{array.array} or L{list} of L{int}
+    @ivar _reverse_index: a dict mapping pointers to their first index, built by L{SimplePointerList.get_by_pointer}
+    @type _reverse_index: L{dict} of L{int} -> L{int} or L{None}
+    @ivar _n_pointer_lookups: number of calls to L{SimplePointerList.get_by_pointer} since the last modification
+    @type _n_pointer_lookups: L{int}
+    @ivar _version: a counter incremented on each modification, used to detect concurrent modifications when building the reverse index
+    @type _version: L{int}
     @ivar _lock_ thread safety lock
     @type _lock: L{threading.Lock}
     """
@@ -72,11 +253,16 @@ class SimplePointerList(ModifiableMixIn):
         The default constructor.
 
         @param pointers: list of pointers contained in this list
-        @type pointers: L{list} of L{int}
+        @type pointers: L{list} or L{array.array} of L{int}
         """
-        assert isinstance(pointers, list)
+        assert isinstance(pointers, (list, array.array))
         ModifiableMixIn.__init__(self)
+        if isinstance(pointers, list) or (pointers.typecode != get_array_typecode(self.POINTER_FORMAT)):
+            pointers = new_pointer_array(self.POINTER_FORMAT, pointers)
         self._pointers = pointers
+        self._reverse_index = None
+        self._n_pointer_lookups = 0
+        self._version = 0
         self._lock = threading.Lock()
 
         # ensure we know the current object size before modifications later
@@ -103,20 +289,39 @@ class SimplePointerList(ModifiableMixIn):
         @type s: L{bytes}
         @return: the pointerlist parsed from the bytes
         @rtype: L{pyzim.pointerlist.SimplePointerList}
+        @raises ValueError: if the length of s is not a multiple of the pointer size
+        """
+        pointer_list = cls._parse_pointers(s)
+        return cls(pointer_list)
+
+    @classmethod
+    def _parse_pointers(cls, s):
         """
-        pointer_size = struct.calcsize(constants.ENDIAN + cls.POINTER_FORMAT)
+        Parse the pointers in the provided bytestring.
+
+        @param s: bytestring to parse
+        @type s: L{bytes}
+        @return: the pointers parsed from the bytes
+        @rtype: L{array.array} or L{list}, see L{new_pointer_array}
+        @raises ValueError: if the length of s is not a multiple of the pointer size
+        """
+        pointer_struct = get_pointer_struct(cls.POINTER_FORMAT)
         length = len(s)
-        if length % pointer_size != 0:
+        if length % pointer_struct.size != 0:
             raise ValueError(
                 "Bytestring to parse into a pointer list must be a multiple of {}, got {}!".format(
-                    pointer_size,
+                    pointer_struct.size,
                     length,
                 ),
             )
-        n = length // pointer_size
-        format = constants.ENDIAN + cls.POINTER_FORMAT * n
-        pointer_list = list(struct.unpack(format, s))
-        return cls(pointer_list)
+        pointers = new_pointer_array(cls.POINTER_FORMAT)
+        if isinstance(pointers, list):
+            pointers.extend(pointer for (pointer, ) in pointer_struct.iter_unpack(s))
+        else:
+            pointers.frombytes(s)
+            if needs_byteswap():
+                pointers.byteswap()
+        return pointers
 
     @classmethod
     def from_file(cls, f, n, seek=None):
@@ -134,11 +339,9 @@ class SimplePointerList(ModifiableMixIn):
         """
         assert isinstance(n, int) and (n >= 0)
         assert isinstance(seek, int) or (seek is None)
-        format = constants.ENDIAN + cls.POINTER_FORMAT * n
         if seek is not None:
             f.seek(seek)
-        data = f.read(struct.calcsize(format))
-        pointer_list = list(struct.unpack(format, data))
+        pointer_list = read_pointers(f, n, cls.POINTER_FORMAT)
         return cls(pointer_list)
 
     @classmethod
@@ -180,15 +383,73 @@ class SimplePointerList(ModifiableMixIn):
         entry = zim.get_entry_by_full_url(full_url).resolve()
         return cls.from_bytes(entry.read())
 
-    def to_bytes(self):
+    def to_bytes(self, buf=None, offset=0):
         """
         Dump this pointer list into a bytestring and return it.
 
-        @return: a bytestring describing this pointer list
-        @rtype: L{bytes}
+        If a buffer is specified, the pointers will be packed directly
+        into this buffer instead of creating a new bytestring.
+
+        @param buf: if specified, a writable buffer to dump this pointer list into
+        @type buf: L{bytearray} or L{memoryview} or L{None}
+        @param offset: offset in buf at which the pointers should be written
+        @type offset: L{int}
+        @return: a bytestring describing this pointer list or buf if specified
+        @rtype: L{bytes} or the type of buf
+        """
+        assert isinstance(offset, int) and offset >= 0
+        if isinstance(self._pointers, list):
+            bulk_struct = get_bulk_pointer_struct(self.POINTER_FORMAT, len(self._pointers))
+            if buf is None:
+                return bulk_struct.pack(*self._pointers)
+            bulk_struct.pack_into(buf, offset, *self._pointers)
+            return buf
+        if needs_byteswap():
+            # swap a copy, as the pointers themselves must stay in native order
+            pointers = self._pointers[:]
+            pointers.byteswap()
+        else:
+            pointers = self._pointers
+        if buf is None:
+            return pointers.tobytes()
+        with memoryview(buf) as view, view.cast("B") as target, memoryview(pointers) as source:
+            size = source.nbytes
+            target[offset:offset + size] = source.cast("B")
+        return buf
+
+    def write_to(self, f, chunksize=8192):
         """
-        format = constants.ENDIAN + self.POINTER_FORMAT * len(self._pointers)
-        return struct.pack(format, *self._pointers)
+        Write this pointer list to a file.
+
+        Unlike L{SimplePointerList.to_bytes}, this does not create a full
+        serialized copy of this pointer list in memory. Instead, the
+        pointers are written directly or in chunks.
+
+        @param f: file-like object to write to
+        @type f: file-like
+        @param chunksize: maximum number of pointers to serialize at once
+        @type chunksize: L{int}
+        @return: the number of bytes written
+        @rtype: L{int}
+        """
+        assert isinstance(chunksize, int) and chunksize > 0
+        n = len(self._pointers)
+        if isinstance(self._pointers, array.array) and not needs_byteswap():
+            # pointers already have the correct memory layout
+            with memoryview(self._pointers) as view, view.cast("B") as data:
+                f.write(data)
+                return data.nbytes
+        written = 0
+        for start in range(0, n, chunksize):
+            chunk = self._pointers[start:start + chunksize]
+            if isinstance(chunk, list):
+                data = get_bulk_pointer_struct(self.POINTER_FORMAT, len(chunk)).pack(*chunk)
+            else:
+                chunk.byteswap()
+                data = chunk.tobytes()
+            f.write(data)
+            written += len(data)
+        return written
 
     def __len__(self):
         """
@@ -237,11 +498,42 @@ class SimplePointerList(ModifiableMixIn):
         @raises KeyError: if pointer not found in archive
         """
         assert isinstance(pointer, int)
-        for i in range(len(self)):
-            listpointer = self._pointers[i]
-            if listpointer == pointer:
-                return i
-        raise KeyError("Pointer {} not found in pointer list!".format(pointer))
+        reverse_index = self._reverse_index
+        if reverse_index is None:
+            with self._lock:
+                version = self._version
+                self._n_pointer_lookups += 1
+                if self._n_pointer_lookups > 1:
+                    # repeated lookups without modification, build a reverse index
+                    # iterate in reverse order so the first index of each pointer is kept
+                    n = len(self._pointers)
+                    reverse_index = dict(zip(reversed(self._pointers), range(n - 1, -1, -1)))
+                    # only publish the index if the list was not modified in the meantime
+                    # as mark_dirty() may run without the lock, check again after publishing
+                    if version == self._version:
+                        self._reverse_index = reverse_index
+                    if version != self._version:
+                        self._reverse_index = None
+                        reverse_index = None
+        if reverse_index is None:
+            # the list is often modified between single lookups,
+            # in which case building a reverse index is not worth it
+            try:
+                return self._pointers.index(pointer)
+            except ValueError:
+                raise KeyError("Pointer {} not found in pointer list!".format(pointer))
+        try:
+            return reverse_index[pointer]
+        except KeyError:
+            raise KeyError("Pointer {} not found in pointer list!".format(pointer))
+
+    def mark_dirty(self):
+        # any modification may invalidate the reverse index
+        # increment the version first, see get_by_pointer()
+        self._version += 1
+        self._reverse_index = None
+        self._n_pointer_lookups = 0
+        ModifiableMixIn.mark_dirty(self)
 
     def append(self, pointer):
         """
@@ -260,6 +552,30 @@ class SimplePointerList(ModifiableMixIn):
             self._pointers.append(pointer)
             self.mark_dirty()
 
+    def extend(self, pointers):
+        """
+        Append multiple pointers to the end of this pointerlist.
+
+        This is equivalent to calling L{SimplePointerList.append} for
+        each pointer, but faster.
+
+        If you are working with a L{pyzim.pointerlist.OrderedPointerList}, you will not want to use this method.
+        Instead, use L{pyzim.pointerlist.OrderedPointerList.add}, which correctly inserts the pointers.
+
+        @param pointers: pointers to add
+        @type pointers: iterable of L{int}
+        @raises pyzim.exceptions.NonMutable: if pointer list is not mutable
+        """
+        if not isinstance(pointers, (list, tuple, array.array)):
+            pointers = list(pointers)
+        assert all(isinstance(pointer, int) and pointer >= 0 for pointer in pointers)
+        self.ensure_mutable()
+        if not pointers:
+            return
+        with self._lock:
+            self._pointers.extend(pointers)
+            self.mark_dirty()
+
     def set(self, i, pointer, add_placeholders=False):
         """
         Set the pointer at the specified index.
@@ -296,8 +612,7 @@ class SimplePointerList(ModifiableMixIn):
                 # placeholders should always point to a valid target
                 # so let's just use the same pointer as well
                 to_add = i - length + 1  # 1 for each missing and 1 for the target itself
-                for i in range(to_add):
-                    self._pointers.append(pointer)
+                self._pointers.extend([pointer] * to_add)
             self.mark_dirty()
 
     def remove_by_index(self, i):
@@ -325,8 +640,8 @@ class SimplePointerList(ModifiableMixIn):
         @type start: L{int}
         @param end: index of last pointer to return (exclusive)
         @type end: L{int}
-        @yield: the pointers in the specified range
-        @ytype: L{int}
+        @return: an iterator over the pointers in the specified range
+        @rtype: iterator of L{int}
         """
         if start is None:
             start = 0
@@ -336,8 +651,9 @@ class SimplePointerList(ModifiableMixIn):
         assert isinstance(end, int) and end <= len(self)
         assert end >= start
 
-        for i in range(start, end):
-            yield self.get_by_index(i)
+        # iterating over a slice of the array avoids a method call per pointer
+        # the slice is a copy, so the list can still be modified while iterating
+        return iter(self._pointers[start:end])
 
     def mass_update(self, diff, start=None, end=None):
         """
@@ -363,23 +679,46 @@ class SimplePointerList(ModifiableMixIn):
         assert isinstance(end, int) or (end is None)
         assert (start is None or end is None) or (end >= start)
 
-        did_modify = False
-
-        for i in range(len(self._pointers)):
-            pointer = self._pointers[i]
-            if (start is not None) and (pointer < start):
-                continue
-            if (end is not None) and (pointer >= end):
-                continue
-            self._pointers[i] += diff
-            did_modify = True
+        modified = self._mass_update(diff, start=start, end=end)
 
         # check if this list should be marked as dirty
-        if did_modify:
+        if modified:
             self.mark_dirty()
 
+    def _mass_update(self, diff, start=None, end=None):
+        """
+        Perform the actual modification for L{SimplePointerList.mass_update}.
+
+        @param diff: value to add to each pointer
+        @type diff: L{int}
+        @param start: min values of pointers to modify (inclusive)
+        @type start: L{int}
+        @param end: max values of pointers to modify (exclusive)
+        @type end: L{int}
+        @return: the indexes of the modified pointers
+        @rtype: L{list} of L{int}
+        """
+        pointers = self._pointers
+        # pointers are unsigned, so no start is equivalent to a start of 0
+        if start is None:
+            start = 0
+        if start == 0 and end is None:
+            # all pointers are modified, replace them in a single pass
+            pointers[:] = new_pointer_array(self.POINTER_FORMAT, map(diff.__add__, pointers))
+            return list(range(len(pointers)))
+        # find all pointers to modify in a single comprehension
+        if end is None:
+            modified = [i for i, pointer in enumerate(pointers) if pointer >= start]
+        else:
+            modified = [i for i, pointer in enumerate(pointers) if start <= pointer < end]
+
+        for i in modified:
+            pointers[i] += diff
+
+        return modified
+
     def get_disk_size(self):
-        return struct.calcsize(constants.ENDIAN + self.POINTER_FORMAT) * len(self._pointers)
+        return get_pointer_struct(self.POINTER_FORMAT).size * len(self._pointers)
 
 
 class OrderedPointerList(SimplePointerList):
@@ -394,8 +733,22 @@ class OrderedPointerList(SimplePointerList):
     contains the pointers, finding a pointer for a key requires the
     loading of the entries via the pointers.
 
+    As loading the entries is expensive, the keys are cached once they
+    have been determined. The cache is kept in sync with all
+    modifications performed via the methods of this pointer list. If
+    the value a pointer refers to is changed otherwise, call
+    L{OrderedPointerList.clear_key_cache}. Once all keys are known (see
+    L{OrderedPointerList.precompute_keys}), lookups are performed
+    directly on the cached keys without calling the key function.
+
     @ivar _keyf: a function that returns the bytestring by which this pointer list is sorted
     @type _keyf: a callable returning L{bytes}
+    @ivar _keys: cached keys for the pointers, L{None} for keys not yet determined
+    @type _keys: L{list} of L{bytes} or L{None}
+    @ivar _keys_complete: if nonzero, all keys are cached
+    @type _keys_complete: L{bool}
+    @ivar _keys_version: a counter incremented on each modification, used to detect concurrent modifications when caching keys
+    @type _keys_version: L{int}
     """
 
     def __init__(self, pointers, key_func):
@@ -409,6 +762,9 @@ class OrderedPointerList(SimplePointerList):
         """
         SimplePointerList.__init__(self, pointers)
         self._keyf = key_func
+        self._keys = [None] * len(self._pointers)
+        self._keys_complete = (len(self._pointers) == 0)
+        self._keys_version = 0
 
     @classmethod
     def new(cls, key_func):
@@ -435,19 +791,9 @@ class OrderedPointerList(SimplePointerList):
         @type key_func: a callable returning L{bytes}
         @return: the pointerlist parsed from the bytes
         @rtype: L{pyzim.pointerlist.OrderedPointerList}
+        @raises ValueError: if the length of s is not a multiple of the pointer size
         """
-        pointer_size = struct.calcsize(constants.ENDIAN + cls.POINTER_FORMAT)
-        length = len(s)
-        if length % pointer_size != 0:
-            raise ValueError(
-                "Bytestring to parse into a pointer list must be a multiple of {}, got {}!".format(
-                    pointer_size,
-                    length,
-                ),
-            )
-        n = length // pointer_size
-        format = constants.ENDIAN + cls.POINTER_FORMAT * n
-        pointer_list = list(struct.unpack(format, s))
+        pointer_list = cls._parse_pointers(s)
         return cls(pointer_list, key_func=key_func)
 
     @classmethod
@@ -468,11 +814,9 @@ class OrderedPointerList(SimplePointerList):
         """
         assert isinstance(n, int) and (n >= 0)
         assert isinstance(seek, int) or (seek is None)
-        format = constants.ENDIAN + cls.POINTER_FORMAT * n
         if seek is not None:
             f.seek(seek)
-        data = f.read(struct.calcsize(format))
-        pointer_list = list(struct.unpack(format, data))
+        pointer_list = read_pointers(f, n, cls.POINTER_FORMAT)
         return cls(pointer_list, key_func=key_func)
 
     @classmethod
@@ -518,6 +862,119 @@ class OrderedPointerList(SimplePointerList):
         entry = zim.get_entry_by_full_url(full_url).resolve()
         return cls.from_bytes(entry.read(), key_func=key_func)
 
+    def _get_key(self, i):
+        """
+        Return the key for the pointer at the specified index.
+
+        The key will be cached.
+
+        @param i: index of pointer to get key for
+        @type i: L{int}
+        @return: the key of the pointer at the index
+        @rtype: L{bytes}
+        """
+        key = self._keys[i]
+        if key is None:
+            version = self._keys_version
+            key = self._keyf(self._pointers[i])
+            if version == self._keys_version:
+                # only cache the key if the list was not modified in the meantime
+                self._keys[i] = key
+        return key
+
+    @staticmethod
+    def _as_key(key):
+        """
+        Return the key as bytes, encoding it if necessary.
+
+        @param key: key to convert
+        @type key: L{str} or L{bytes}
+        @return: the key as bytes
+        @rtype: L{bytes}
+        """
+        if isinstance(key, str):
+            return key.encode(constants.ENCODING)
+        return key
+
+    def _search(self, key):
+        """
+        Return the index of the first pointer whose key is greater or equal to the key.
+
+        @param key: key to search for
+        @type key: L{bytes}
+        @return: the first index for which all subsequent keys are >= the specified key
+        @rtype: L{int}
+        """
+        if self._keys_complete:
+            return bisect.bisect_left(self._keys, key)
+        return binarysearch(range(len(self)), key, key=self._get_key)
+
+    def precompute_keys(self):
+        """
+        Determine and cache the keys of all pointers in this list.
+
+        Afterwards, lookups no longer need to call the key function
+        until pointers without known keys are added.
+        """
+        with self._lock:
+            for i in range(len(self._pointers)):
+                self._get_key(i)
+            self._keys_complete = True
+
+    def clear_key_cache(self):
+        """
+        Clear the cached keys of this pointer list.
+
+        This needs to be called if the values the pointers refer to
+        were modified without modifying this pointer list.
+        """
+        with self._lock:
+            self._keys = [None] * len(self._pointers)
+            self._keys_complete = (len(self._pointers) == 0)
+            self._keys_version += 1
+
+    def append(self, pointer):
+        SimplePointerList.append(self, pointer)
+        with self._lock:
+            self._keys.append(None)
+            self._keys_complete = False
+            self._keys_version += 1
+
+    def extend(self, pointers):
+        n_old = len(self._pointers)
+        SimplePointerList.extend(self, pointers)
+        with self._lock:
+            if len(self._pointers) > n_old:
+                self._keys.extend([None] * (len(self._pointers) - n_old))
+                self._keys_complete = False
+            self._keys_version += 1
+
+    def set(self, i, pointer, add_placeholders=False):
+        SimplePointerList.set(self, i, pointer, add_placeholders=add_placeholders)
+        with self._lock:
+            if i < len(self._keys):
+                self._keys[i] = None
+            self._keys.extend([None] * (len(self._pointers) - len(self._keys)))
+            self._keys_complete = False
+            self._keys_version += 1
+
+    def remove_by_index(self, i):
+        SimplePointerList.remove_by_index(self, i)
+        with self._lock:
+            del self._keys[i]
+            self._keys_version += 1
+
+    def _mass_update(self, diff, start=None, end=None):
+        modified = SimplePointerList._mass_update(self, diff, start=start, end=end)
+        if modified:
+            # the keys of modified pointers may have changed as well
+            with self._lock:
+                for i in modified:
+                    self._keys[i] = None
+                self._keys_complete = False
+                self._keys_version += 1
+        return modified
+
     def get(self, key):
         """
         Return the pointer for the specified key.
@@ -546,10 +1003,9 @@ class OrderedPointerList(SimplePointerList):
         @raises KeyError: when no matching key was found.
         """
         assert isinstance(key, (str, bytes))
-        if isinstance(key, str):
-            key = key.encode(constants.ENCODING)
-        i = binarysearch(self, key, key=self._keyf)
-        if i != len(self) and self._keyf(self.get_by_index(i)) == key:
+        key = self._as_key(key)
+        i = self._search(key)
+        if i != len(self) and self._get_key(i) == key:
             return i
         raise KeyError("No pointer matching key '{}' found!".format(key))
 
@@ -557,20 +1013,18 @@ class OrderedPointerList(SimplePointerList):
         """
         Check if this pointer list has a pointer matching the key.
 
-        This method calls L{OrderedPointerList.get} internally, so it's faster
-        to not call this before get().
+        This method performs the same search as L{OrderedPointerList.get},
+        so it's faster to not call this before get().
 
         @param key: key to check the presence of a matching pointer for
         @type key: L{bytes} or L{str}
         @return: True if the key is present, False otherwise
         @rtype: L{bool}
         """
-        try:
-            self.get(key)
-        except KeyError:
-            return False
-        else:
-            return True
+        assert isinstance(key, (str, bytes))
+        key = self._as_key(key)
+        i = self._search(key)
+        return (i != len(self)) and (self._get_key(i) == key)
 
     def add(self, key, pointer):
         """
@@ -586,15 +1040,49 @@ class OrderedPointerList(SimplePointerList):
         """
         assert isinstance(key, (str, bytes))
         assert isinstance(pointer, int) and (pointer >= 0)
-        if isinstance(key, str):
-            key = key.encode(constants.ENCODING)
+        key = self._as_key(key)
         self.ensure_mutable()
         with self._lock:
-            i = binarysearch(self, key, key=self._keyf)
+            i = self._search(key)
             self._pointers.insert(i, pointer)
+            self._keys.insert(i, key)
+            self._keys_version += 1
             self.mark_dirty()
         return i
 
+    def add_many(self, pairs):
+        """
+        Add multiple key/pointer pairs to this pointer list.
+
+        Unlike calling L{OrderedPointerList.add} for each pair, this
+        sorts all pointers only once instead of shifting the pointers
+        for each insertion, which is significantly faster when adding
+        many pointers at once.
+
+        @param pairs: key/pointer pairs to add
+        @type pairs: iterable of L{tuple} of (L{str} or L{bytes}, L{int})
+        @raises pyzim.exceptions.NonMutable: if pointer list is not mutable
+        """
+        new_pairs = []
+        for key, pointer in pairs:
+            assert isinstance(key, (str, bytes))
+            assert isinstance(pointer, int) and (pointer >= 0)
+            key = self._as_key(key)
+            new_pairs.append((key, pointer))
+        self.ensure_mutable()
+        if not new_pairs:
+            return
+        with self._lock:
+            all_pairs = [(self._get_key(i), self._pointers[i]) for i in range(len(self._pointers))]
+            all_pairs.extend(new_pairs)
+            # the existing pairs are already sorted, which the sort algorithm takes advantage of
+            all_pairs.sort(key=operator.itemgetter(0))
+            self._pointers = new_pointer_array(self.POINTER_FORMAT, [pointer for (key, pointer) in all_pairs])
+            self._keys = [key for (key, pointer) in all_pairs]
+            self._keys_complete = True
+            self._keys_version += 1
+            self.mark_dirty()
+
     def remove(self, key):
         """
         Remove a pointer from this pointer list.
@@ -605,13 +1093,14 @@ class OrderedPointerList(SimplePointerList):
         @raises pyzim.exceptions.NonMutable: if pointer list is not mutable
         """
         assert isinstance(key, (bytes, str))
-        if isinstance(key, str):
-            key = key.encode(constants.ENCODING)
+        key = self._as_key(key)
         self.ensure_mutable()
         with self._lock:
-            i = binarysearch(self, key, key=self._keyf)
-            if i != len(self._pointers) and self._keyf(self._pointers[i]) == key:
+            i = self._search(key)
+            if i != len(self._pointers) and self._get_key(i) == key:
                 del self._pointers[i]
+                del self._keys[i]
+                self._keys_version += 1
                 self.mark_dirty()
             else:
                 raise KeyError("No pointer matching key '{}' found!".format(key))
@@ -631,9 +1120,8 @@ class OrderedPointerList(SimplePointerList):
         @rtype: L{int}
         """
         assert isinstance(key, (str, bytes))
-        if isinstance(key, str):
-            key = key.encode(constants.ENCODING)
-        return binarysearch(self, key, key=self._keyf)
+        key = self._as_key(key)
+        return self._search(key)
 
     def iter_values(self, start=None, end=None):
         """
@@ -648,19 +1136,21 @@ class OrderedPointerList(SimplePointerList):
         @type start: L{int}
         @param end: index of last pointer to return value of (exclusive)
         @type end: L{int}
-        @yield: the pointers in the specified range
-        @ytype: L{int}
+        @return: an iterator over the values in the specified range
+        @rtype: iterator of L{bytes}
         """
         if start is None:
             start = 0
         if end is None:
-            end = len(self._pointers)
+            end = len(self)
         assert isinstance(start, int) and start >= 0
-        assert isinstance(end, int) and end <= len(self._pointers)
+        assert isinstance(end, int) and end <= len(self)
         assert end >= start
 
-        for i in range(start, end):
-            yield self._keyf(self.get_by_index(i))
+        if self._keys_complete:
+            # all keys are cached, iterate over a copy of them directly
+            return iter(self._keys[start:end])
+        return map(self._get_key, range(start, end))
 
     def check_sorted(self):
         """
@@ -668,10 +1158,12 @@ class OrderedPointerList(SimplePointerList):
 
         @raises pyzim.exceptions.UnsortedList: when the pointers are not correctly ordered.
         """
-        last_key = None
-        for pointer in self.iter_pointers():
-            key = self._keyf(pointer)
-            if (last_key is not None) and (last_key > key):
+        # compare each key with its successor, computing each key only once
+        # iter_values() lets subclasses determine the keys in bulk
+        keys, next_keys = itertools.tee(self.iter_values())
+        next(next_keys, None)
+        for last_key, key in zip(keys, next_keys):
+            if last_key > key:
                 # sort order violated
                 raise exceptions.UnsortedList(
                     "{} contains at least two keys in wrong order: {} > {}".format(
@@ -680,7 +1172,6 @@ class OrderedPointerList(SimplePointerList):
                         repr(key),
                     ),
                 )
-            last_key = key
 
     def print_content(self):  # pragma: no cover
         """
@@ -688,7 +1179,7 @@ class OrderedPointerList(SimplePointerList):
         """
         for i in range(len(self)):
             pointer = self.get_by_index(i)
-            print("{} -> {}: {}".format(i, pointer, repr(self._keyf(pointer))))
+            print("{} -> {}: {}".format(i, pointer, repr(self._get_key(i))))
 
 
 class TitlePointerList(OrderedPointerList):
@@ -700,6 +1191,16 @@ class TitlePointerList(OrderedPointerList):
     """
     POINTER_FORMAT = "I"
 
+    def _mass_update(self, diff, start=None, end=None):
+        # title pointers are only mass-updated when the entries they
+        # refer to are moved within the URL pointer list. The pointers
+        # still refer to the same entries, so the cached keys stay valid.
+        modified = SimplePointerList._mass_update(self, diff, start=start, end=end)
+        if modified:
+            with self._lock:
+                self._keys_version += 1
+        return modified
+
 
 # ============ ON-DISK VARIANTS =============
 
@@ -710,6 +1211,9 @@ class OnDiskSimplePointerList(SimplePointerList):
 
     This should be more RAM efficient, but beware that it is likely quite slow.
 
+    @cvar ITER_CHUNK_SIZE: number of pointers to read at once in L{OnDiskSimplePointerList.iter_pointers}
+    @type ITER_CHUNK_SIZE: L{int}
+
     @ivar _zim: zim this pointer list is part of
     @type _zim: L{pyzim.archive.Zim}
     @ivar _offset: offset of this pointerlist in the zim file
@@ -718,7 +1222,12 @@ class OnDiskSimplePointerList(SimplePointerList):
     @type _n: L{int}
     @ivar _item_size: the size of each item in this list in bytes
     @type _item_size: L{int}
+    @ivar _pointer_struct: the struct used to parse a single pointer
+    @type _pointer_struct: L{struct.Struct}
     """
+
+    ITER_CHUNK_SIZE = 1024
+
     def __init__(self, zim, offset, n):
         """
         The default constructor.
@@ -734,7 +1243,8 @@ class OnDiskSimplePointerList(SimplePointerList):
         self._zim = zim
         self._offset = offset
         self._n = n
-        self._item_size = struct.calcsize(constants.ENDIAN + self.POINTER_FORMAT)
+        self._pointer_struct = get_pointer_struct(self.POINTER_FORMAT)
+        self._item_size = self._pointer_struct.size
         self.mutable = False
 
     @classmethod
@@ -762,7 +1272,7 @@ class OnDiskSimplePointerList(SimplePointerList):
     def from_zim_entry(cls, zim, full_url):
         entry = zim.get_entry_by_full_url(full_url).resolve()
         size = entry.get_size()
-        n = (size // struct.calcsize(constants.ENDIAN + cls.POINTER_FORMAT))
+        n = (size // get_pointer_struct(cls.POINTER_FORMAT).size)
         cluster = entry.get_cluster()
         offset = cluster.offset + 1 + cluster.get_offset(entry.blob_number)
         return cls.from_zim_file(zim, n, seek=offset)
@@ -778,11 +1288,51 @@ class OnDiskSimplePointerList(SimplePointerList):
         with self._zim.acquire_file() as f:
             f.seek(full_offset)
             data = f.read(self._item_size)
-        pointer = struct.unpack(constants.ENDIAN + self.POINTER_FORMAT, data)[0]
+        pointer = self._pointer_struct.unpack(data)[0]
         return pointer
 
+    def get_by_pointer(self, pointer):
+        assert isinstance(pointer, int)
+        # scan the pointers on disk rather than indexing the empty in-memory list
+        for i, listpointer in enumerate(self.iter_pointers()):
+            if listpointer == pointer:
+                return i
+        raise KeyError("Pointer {} not found in pointer list!".format(pointer))
+
+    def iter_pointers(self, start=None, end=None):
+        if start is None:
+            start = 0
+        if end is None:
+            end = len(self)
+        assert isinstance(start, int) and start >= 0
+        assert isinstance(end, int) and end <= len(self)
+        assert end >= start
+
+        # read the pointers in chunks rather than one at a time
+        for chunk_start in range(start, end, self.ITER_CHUNK_SIZE):
+            n = min(self.ITER_CHUNK_SIZE, end - chunk_start)
+            with self._zim.acquire_file() as f:
+                f.seek(self._offset + (chunk_start * self._item_size))
+                pointers = read_pointers(f, n, self.POINTER_FORMAT)
+            yield from pointers
+
 
 class OnDiskOrderedPointerList(OnDiskSimplePointerList, OrderedPointerList):
+    """
+    A variant of L{OrderedPointerList} that reads pointers always from the disk.
+
+    Only a limited number of keys is cached. As binary searches always
+    start at the same indexes, this is enough to avoid reading the
+    upper levels of the search from the disk for each lookup.
+
+    @cvar KEY_CACHE_SIZE: maximum number of keys to cache
+    @type KEY_CACHE_SIZE: L{int}
+
+    @ivar _cached_get_key: the LRU-cached function used to determine the key at an index
+    @type _cached_get_key: a callable returning L{bytes}
+    """
+
+    KEY_CACHE_SIZE = 256
 
     def __init__(self, zim, offset, n, key_func):
         """
@@ -799,6 +1349,34 @@ class OnDiskOrderedPointerList(OnDiskSimplePointerList, OrderedPointerList):
         """
         OrderedPointerList.__init__(self, pointers=[], key_func=key_func)
         OnDiskSimplePointerList.__init__(self, zim=zim, offset=offset, n=n)
+        self._keys_complete = False
+        self._cached_get_key = functools.lru_cache(maxsize=self.KEY_CACHE_SIZE)(self._read_key)
+
+    def _read_key(self, i):
+        """
+        Read the pointer at the specified index and return its key.
+
+        @param i: index of pointer to get key for
+        @type i: L{int}
+        @return: the key of the pointer at the index
+        @rtype: L{bytes}
+        """
+        return self._keyf(self.get_by_index(i))
+
+    def _get_key(self, i):
+        # not all keys are cached, as this would defeat the purpose of this class
+        return self._cached_get_key(i)
+
+    def precompute_keys(self):
+        # not all keys are cached, as this would defeat the purpose of this class
+        pass
+
+    def clear_key_cache(self):
+        self._cached_get_key.cache_clear()
+
+    def iter_values(self, start=None, end=None):
+        # read the pointers in chunks rather than one at a time
+        return map(self._keyf, self.iter_pointers(start, end))
 
     @classmethod
     def new(cls, key_func):
@@ -825,7 +1403,7 @@ class OnDiskOrderedPointerList(OnDiskSimplePointerList, OrderedPointerList):
     def from_zim_entry(cls, zim, full_url, key_func):
         entry = zim.get_entry_by_full_url(full_url).resolve()
         size = entry.get_size()
-        n = (size // struct.calcsize(constants.ENDIAN + cls.POINTER_FORMAT))
+        n = (size // get_pointer_struct(cls.POINTER_FORMAT).size)
         cluster = entry.get_cluster()
         offset = cluster.offset + 1 + cluster.get_offset(entry.blob_number)
         return cls.from_zim_file(zim, n, seek=offset, key_func=key_func)
@@ -8,6 +8,8 @@ from .constants import LOG_LEVEL_ALLOCATION
 
 import threading
 import logging
+import bisect
+import array
 
 from .bindable import BindableMixIn
 
@@ -38,8 +40,14 @@ class SpaceAllocator(BindableMixIn):
     Additionally, this method also keeps track of the end of the file,
     so that we know where we can append data.
 
-    @ivar free_blocks: a list of tuples of (offset, size) indicating free locations
-    @type free_blocks: L{list} of L{tuple} of (L{int}, L{int})
+    The free blocks are stored as two parallel arrays of offsets and
+    sizes, sorted by offset. See L{SpaceAllocator.free_blocks} for a
+    list of (offset, size) tuples.
+
+    @ivar _starts: offsets of the free blocks, sorted
+    @type _starts: L{array.array} of L{int}
+    @ivar _lengths: sizes of the free blocks, in the same order as L{SpaceAllocator._starts}
+    @type _lengths: L{array.array} of L{int}
     @ivar file_end: offset to the end of the file (first non-written byte)
     @type file_end: L{int}
     @ivar lock: thread-safety lock
@@ -56,13 +64,25 @@ class SpaceAllocator(BindableMixIn):
         """
         assert isinstance(free_blocks, list) or free_blocks is None
         assert isinstance(file_end, int)
-        if free_blocks is None:
-            self.free_blocks = []
-        else:
-            self.free_blocks = free_blocks[:]
+        self._starts = array.array("q")
+        self._lengths = array.array("q")
+        if free_blocks is not None:
+            for start, length in free_blocks:
+                self._starts.append(start)
+                self._lengths.append(length)
         self.file_end = file_end
         self.lock = threading.Lock()
 
+    @property
+    def free_blocks(self):
+        """
+        The free blocks as a list of tuples of (offset, size), sorted by offset.
+
+        @return: a list of tuples of (offset, size) indicating free locations
+        @rtype: L{list} of L{tuple} of (L{int}, L{int})
+        """
+        return list(zip(self._starts, self._lengths))
+
     def allocate(self, block_size):
         """
         Allocate some space inside the file and return an offset at which
@@ -90,34 +110,39 @@ class SpaceAllocator(BindableMixIn):
             # locate smallest free block of sufficient size
             min_size = None
             best_index = None
-            for index, (start, length) in enumerate(self.free_blocks):
+            for index, length in enumerate(self._lengths):
                 if length >= block_size and (min_size is None or length < min_size):
                     min_size = length
                     best_index = index
+                    if length == block_size:
+                        # no smaller block can fit
+                        break
 
             if best_index is not None:
                 # a free block has been found
-                start, length = self.free_blocks[best_index]
+                start = self._starts[best_index]
+                length = self._lengths[best_index]
                 if length > block_size:
                     # reduce remaining free block size
-                    new_start = start + block_size
-                    self.free_blocks[best_index] = (new_start, length - block_size)
+                    self._starts[best_index] = start + block_size
+                    self._lengths[best_index] = length - block_size
                 else:
                     # remove block
-                    self.free_blocks.pop(best_index)
+                    del self._starts[best_index]
+                    del self._lengths[best_index]
                 logger.log(LOG_LEVEL_ALLOCATION, "Allocated {} bytes in free block at {}, leaving {} bytes free".format(block_size, start, length - block_size))
                 return start
 
             # no free block of sufficient size found
-            trailing_free_index = len(self.free_blocks) - 1
-            if trailing_free_index >= 0:
+            if self._starts:
                 # we have at least one free block
-                trailing_free_block = self.free_blocks[trailing_free_index]
-                if trailing_free_block[0] + trailing_free_block[1] == self.file_end:
+                start = self._starts[-1]
+                length = self._lengths[-1]
+                if start + length == self.file_end:
                     # there is a free block directly prior to the file end
                     # use this one up first
-                    start, length = self.free_blocks[trailing_free_index]
-                    self.free_blocks.pop(trailing_free_index)
+                    del self._starts[-1]
+                    del self._lengths[-1]
                     extra_bytes_needed = max(block_size - length, 0)
                     self.file_end += extra_bytes_needed
                     logger.log(LOG_LEVEL_ALLOCATION, "Allocated {} bytes at file end at {}, recycling {} bytes from a free trailing block".format(block_size, start, length))
@@ -149,47 +174,37 @@ class SpaceAllocator(BindableMixIn):
 
         # we are modifying the internal list of free blocks, so acquire lock
         with self.lock:
-            # find insertion point (bisect will likely be uncecessary)
-            # also use this opportunity to copy the list
-            new_blocks = []
-            insert_index = 0
-            for i, block in enumerate(self.free_blocks):
-                new_blocks.append(block)
-                block_start, block_length = block
-                if block_start <= start:
-                    insert_index = i + 1
-            # insert new block
-            new_blocks.insert(insert_index, (start, length))
-
-            # join adjacent and overlapping blocks
-            # we do this by always comparing it to the previous block
-            prev_block = None
-            i = 0
-            while i < len(new_blocks):
-                block = new_blocks[i]
-                block_start, block_length = block
-                block_end = block_start + block_length
-                if i == 0:
-                    # first block won't be merged
-                    i += 1
-                    prev_block = block
-                    continue
-                # check if block is adjacent or overlapping
-                prev_block_end = prev_block[0] + prev_block[1]
-                if prev_block_end >= block_start:
-                    # adjacent, merge
-                    merged_end = max(prev_block_end, block_end)
-                    merged_block_length = merged_end - prev_block[0]
-                    merged_block = (prev_block[0], merged_block_length)
-                    # overwrite previous block and remove current block
-                    new_blocks[i-1] = prev_block = merged_block
-                    del new_blocks[i]
+            # the free blocks are sorted by offset and neither overlap
+            # nor are adjacent, so only the direct neighbors of the new
+            # block may need to be merged with it
+            end = start + length
+            if (not self._starts) or (start >= self._starts[-1]):
+                # common case: the new block does not start before any
+                # other free block, so only the last block may be merged
+                if self._starts and (self._starts[-1] + self._lengths[-1] >= start):
+                    self._lengths[-1] = max(end - self._starts[-1], self._lengths[-1])
                 else:
-                    # non-adjacent
-                    prev_block = block
-                    i += 1
-
-            self.free_blocks = new_blocks
+                    self._starts.append(start)
+                    self._lengths.append(length)
+                return
+            # index of first block starting after the new block
+            i = bisect.bisect_right(self._starts, start)
+            if i > 0:
+                prev_start = self._starts[i - 1]
+                prev_length = self._lengths[i - 1]
+                if prev_start + prev_length >= start:
+                    # previous block is adjacent or overlapping, merge
+                    i -= 1
+                    start = prev_start
+                    end = max(end, prev_start + prev_length)
+            # find all following blocks that are adjacent or overlapping
+            j = i
+            while j < len(self._starts) and self._starts[j] <= end:
+                end = max(end, self._starts[j] + self._lengths[j])
+                j += 1
+            # replace the merged blocks with the new block
+            self._starts[i:j] = array.array("q", (start, ))
+            self._lengths[i:j] = array.array("q", (end - start, ))
 
     def print_status(self):
         """
@@ -3,10 +3,20 @@ Various I/O related utility functions.
 """
 
 
+# number of bytes read at once when searching for a zero byte
+READ_UNTIL_ZERO_CHUNK_SIZE = 1024
+# reads up to this size are first attempted with a single read() call
+SMALL_READ_SIZE = 64
+
+
 def read_until_zero(f, encoding=None, strip_zero=True):
     """
     Read a zero-terminated bytestring from a file.
 
+    If the file is seekable, it is read in chunks and any bytes read
+    past the zero are un-read by seeking backwards. Otherwise, the file
+    is read byte by byte.
+
     @param f: file-like object to read from
     @type f: file-like object
     @param encoding: if specified, decode the string using this encoding
@@ -15,16 +25,30 @@ def read_until_zero(f, encoding=None, strip_zero=True):
     @type strip_zero: L{bool}
     @return: the parsed string.
     @rtype: L{bytes} or L{str} if an encoding was specified
+    @raises IOError: if EOF was encountered before a zero was found
     """
-    s = b""
+    # only used if the string spans multiple chunks
+    head = bytearray()
+    seekable = getattr(f, "seekable", None)
+    chunk_size = (READ_UNTIL_ZERO_CHUNK_SIZE if (seekable is not None and seekable()) else 1)
     while True:
-        c = f.read(1)
-        if c == b"\x00":
-            if not strip_zero:
-                s += c
-            break
+        chunk = f.read(chunk_size)
+        if not chunk:
+            raise IOError("Encountered EOF before reading a zero byte ({} bytes read)!".format(len(head)))
+        idx = chunk.find(b"\x00")
+        if idx == -1:
+            head += chunk
+            continue
+        if idx + 1 < len(chunk):
+            f.seek(idx + 1 - len(chunk), 1)
+        if not strip_zero:
+            idx += 1
+        if head:
+            head += chunk[:idx]
+            s = bytes(head)
         else:
-            s += c
+            s = chunk[:idx]
+        break
     if encoding is not None:
         return s.decode(encoding)
     else:
@@ -48,14 +72,39 @@ def read_n_bytes(f, n, raise_on_incomplete=False):
     @rtype: L{bytes}
     @raises IOError: when raise_in_incomplete is nonzero and unable to read full n bytes.
     """
-    rbuff = b""
-    remaining_read = n
-    while remaining_read > 0:
-        data = f.read(remaining_read)
-        if not data:
-            if remaining_read and raise_on_incomplete:
-                raise IOError("Encountered EOF before reading full {} bytes ({} read)!".format(n, len(rbuff)))
-            break
-        rbuff += data
-        remaining_read -= len(data)
-    return rbuff
+    if n <= SMALL_READ_SIZE:
+        # small reads are usually satisfied by a single call
+        data = f.read(n)
+        if len(data) == n:
+            return data
+        if data:
+            data += read_n_bytes(f, n - len(data))
+        if (len(data) < n) and raise_on_incomplete:
+            raise IOError("Encountered EOF before reading full {} bytes ({} read)!".format(n, len(data)))
+        return data
+    readinto = getattr(f, "readinto", None)
+    if readinto is None:
+        # file does not support readinto(), fall back to read()
+        rbuff = bytearray()
+        while len(rbuff) < n:
+            data = f.read(n - len(rbuff))
+            if not data:
+                break
+            rbuff += data
+        got = len(rbuff)
+    else:
+        # read directly into a single, preallocated buffer
+        rbuff = bytearray(n)
+        view = memoryview(rbuff)
+        got = 0
+        while got < n:
+            r = readinto(view[got:])
+            if not r:
+                break
+            got += r
+        view.release()
+        if got < n:
+            del rbuff[got:]
+    if (got < n) and raise_on_incomplete:
+        raise IOError("Encountered EOF before reading full {} bytes ({} read)!".format(n, got))
+    return bytes(rbuff)
@@ -1,6 +1,9 @@
 """
 Iteration utilities.
 """
+import itertools
+import operator
+
 from ..archive import Zim
 
 
@@ -19,7 +22,8 @@ def iter_by_cluster(zim):
     iterating. Consequently, this method may have a significant I/O
     overhead and RAM usage.
 
-    Redirects are yielded as their own group after the other groups.
+    Redirects are yielded as their own group after the other groups. If
+    the archive contains no redirects, this group is omitted.
 
     @param zim: ZIM archive to iterate iver
     @type zim: L{pyzim.archive.Zim}
@@ -29,27 +33,18 @@ def iter_by_cluster(zim):
     """
     if not isinstance(zim, Zim):
         raise TypeError("Expected a Zim, got {} instead!".format(type(zim)))
-    cluster_num2urls = {}  # map cluster_num -> [(blob_num, url), ...]
-    # group entries
+    content = []  # list of (cluster_num, blob_num, url)
+    redirects = []  # list of urls
+    # collect entries
     for entry in zim.iter_entries_by_url():
-        url = entry.full_url
         if entry.is_redirect:
-            cluster_num = -1
-            blob_num = -1
+            redirects.append(entry.full_url)
         else:
-            cluster_num = entry.cluster_number
-            blob_num = entry.blob_number
-        if cluster_num not in cluster_num2urls:
-            cluster_num2urls[cluster_num] = []
-        cluster_num2urls[cluster_num].append((blob_num, url))
+            content.append((entry.cluster_number, entry.blob_number, entry.full_url))
     # yield regular entries
-    cluster_nums = sorted(cluster_num2urls.keys())
-    for cluster_num in cluster_nums:
-        if cluster_num == -1:
-            # we yield the redirects later
-            continue
-        entries = cluster_num2urls[cluster_num]
-        entries = tuple(e[1] for e in sorted(entries))
-        yield entries
+    content.sort()
+    for _, group in itertools.groupby(content, key=operator.itemgetter(0)):
+        yield tuple(e[2] for e in group)
     # yield the redirects
-    yield tuple(e[1] for e in cluster_num2urls[-1])
+    if redirects:
+        yield tuple(redirects)
@@ -76,8 +76,12 @@ class TestBase(object):
     @type TEST_ZIM_META: L{dict} of L{str} -> L{str}
     @cvar NUM_ENTRIES: expected number of entries in the standard test ZIM file
     @type NUM_ENTRIES: L{int}
+    @cvar _zimcheck_installed: cached result of L{TestBase.has_zimcheck}, L{None} if not yet checked
+    @type _zimcheck_installed: L{bool} or L{None}
     """
 
+    _zimcheck_installed = None
+
     TEST_ZIM_META = {
             "Name": "testzim",
             "Title": "Test Zim",
@@ -148,16 +152,23 @@ class TestBase(object):
         """
         Check if the 'zimcheck' tool is installed.
 
+        The result is cached, so zimcheck is only looked up once.
+
         @return: True if zimcheck is installed
         @rtype: L{bool}
         """
-        try:
-            subprocess.check_call(["zimcheck", "--version"])
-        except subprocess.CalledProcessError:
-            # zimcheck exited with error code 0
-            return False
-        else:
-            return True
+        if TestBase._zimcheck_installed is None:
+            try:
+                subprocess.check_call(["zimcheck", "--version"])
+            except subprocess.CalledProcessError:
+                # zimcheck exited with an error code
+                TestBase._zimcheck_installed = False
+            except OSError:
+                # zimcheck not found
+                TestBase._zimcheck_installed = False
+            else:
+                TestBase._zimcheck_installed = True
+        return TestBase._zimcheck_installed
 
     def run_zimcheck(self, path):
         """
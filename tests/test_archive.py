@@ -551,6 +551,23 @@ class ZimWriterTests(unittest.TestCase, TestBase):
             if self.has_zimcheck():
                 self.run_zimcheck(zimdir.get_full_path())
 
+    def test_get_entries_by_full_urls(self):
+        """
+        Test L{pyzim.archive.Zim.get_entries_by_full_urls}.
+        """
+        full_urls = ["Cmarkdown.md", "Chome.txt", "Tnamespace.txt", "Chome.txt"]
+        with self.open_temp_dir() as zimdir:
+            with zimdir.open(mode="w") as zim:
+                self.populate_zim(zim)
+                zim.flush()
+                entries = zim.get_entries_by_full_urls(full_urls)
+                self.assertEqual([entry.full_url for entry in entries], full_urls)
+                self.assertEqual(entries[1].read(), b"This is the mainpage.")
+                self.assertEqual(entries[2].read(), b"Namespace test")
+                self.assertEqual(zim.get_entries_by_full_urls([]), [])
+                with self.assertRaises(exceptions.EntryNotFound):
+                    zim.get_entries_by_full_urls(["Chome.txt", "Cnonexistent.html"])
+
     def test_cluster_autoflush(self):
         """
         Test that autoflush works for clusters.
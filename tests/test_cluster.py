@@ -8,7 +8,7 @@ from unittest import mock
 
 from pyzim import constants, exceptions
 from pyzim.blob import InMemoryBlobSource
-from pyzim.cluster import Cluster, OffsetRememberingCluster, InMemoryCluster, ModifiableClusterWrapper, EmptyCluster
+from pyzim.cluster import Cluster, OffsetRememberingCluster, BlobCachingCluster, InMemoryCluster, ModifiableClusterWrapper, EmptyCluster
 from pyzim.compression import CompressionType
 from pyzim.policy import Policy
 
@@ -462,6 +462,46 @@ class OffsetRememberingClusterTests(ClusterTests):
             self.assertIsNone(cluster._offsets)
 
 
+class BlobCachingClusterTests(OffsetRememberingClusterTests):
+    """
+    Tests for L{pyzim.cluster.BlobCachingCluster}.
+    """
+    cluster_class = BlobCachingCluster
+
+    def test_reset_blob_cache(self):
+        """
+        Test L{pyzim.cluster.BlobCachingCluster.reset}.
+        """
+        with self.open_zts_small(policy=self.get_policy()) as zim:
+            cluster = zim.get_cluster_by_index(0)
+            cluster.read_blob(0)
+            self.assertTrue(cluster._blob_cache.has(0))
+            cluster.reset()
+            self.assertFalse(cluster._blob_cache.has(0))
+
+    def test_blob_cache(self):
+        """
+        Test that blobs are only decompressed once.
+        """
+        with self.open_temp_dir() as zimdir:
+            with zimdir.open(mode="w") as zim:
+                self.populate_zim(zim)
+            with zimdir.open(mode="r", policy=self.get_policy()) as zim:
+                entry = zim.get_entry_by_full_url("Chome.txt")
+                cluster = entry.get_cluster()
+                self.assertIsInstance(cluster, BlobCachingCluster)
+                with mock.patch.object(OffsetRememberingCluster, "read_blob", autospec=True, side_effect=OffsetRememberingCluster.read_blob) as read_mock:
+                    content = cluster.read_blob(entry.blob_number)
+                    self.assertEqual(content, b"This is the mainpage.")
+                    self.assertEqual(cluster.read_blob(entry.blob_number), content)
+                    self.assertEqual(b"".join(cluster.iter_read_blob(entry.blob_number, buffersize=3)), content)
+                    self.assertEqual(read_mock.call_count, 1)
+                    # the cache should be cleared on reset
+                    cluster.reset()
+                    self.assertEqual(cluster.read_blob(entry.blob_number), content)
+                    self.assertEqual(read_mock.call_count, 2)
+
+
 class InMemoryClusterTests(OffsetRememberingClusterTests):
     """
     Tests for L{pyzim.cluster.InMemoryCluster}.
@@ -527,6 +567,46 @@ class ModifiableClusterWrapperTests(ClusterTests):
                 modified_data = self.get_data_in_cluster(cluster)
                 self.assertEqual(unmodified_data, modified_data[:-1])
 
+    def test_get_disk_size_cached(self):
+        """
+        Test that L{pyzim.cluster.ModifiableClusterWrapper.get_disk_size} is cached until modified.
+        """
+        with self.open_temp_dir() as zimdir:
+            with zimdir.open(mode="w") as zim:
+                cluster = zim.new_cluster()
+                cluster.append_blob(InMemoryBlobSource(b"test"))
+                with mock.patch.object(cluster, "iter_write", wraps=cluster.iter_write) as iter_write:
+                    size = cluster.get_disk_size()
+                    self.assertEqual(cluster.get_disk_size(), size)
+                    self.assertEqual(iter_write.call_count, 1)
+                    # modifications should invalidate the cache
+                    cluster.append_blob(InMemoryBlobSource(b"a larger blob" * 32))
+                    self.assertNotEqual(cluster.get_disk_size(), size)
+                    self.assertEqual(iter_write.call_count, 2)
+                    # as should changing the extension status
+                    cluster.is_extended = True
+                    cluster.get_disk_size()
+                    self.assertEqual(iter_write.call_count, 3)
+                    cluster.get_disk_size()
+                    self.assertEqual(iter_write.call_count, 3)
+                    cluster.is_extended = None
+                    # writing the cluster should not require an additional size calculation
+                    size = cluster.get_disk_size()
+                    calls = iter_write.call_count
+                    zim.write_cluster(cluster)
+                    self.assertEqual(iter_write.call_count, calls + 1)
+                    self.assertFalse(cluster.dirty)
+                    self.assertEqual(cluster.get_unmodified_disk_size(), size)
+                    # (un)binding should invalidate the cache, as the size depends on the archive
+                    cluster.get_disk_size()
+                    calls = iter_write.call_count
+                    cluster.unbind()
+                    self.assertIsNone(cluster._cached_disk_size)
+                    cluster.bind(zim)
+                    self.assertIsNone(cluster._cached_disk_size)
+                    cluster.get_disk_size()
+                    self.assertEqual(iter_write.call_count, calls + 1)
+
     def test_append_new_cluster(self):
         """
         Test L{pyzim.cluster.ModifiableClusterWrapper.append} with a new cluster.
@@ -894,6 +974,7 @@ class ClusterBehaviorEquivalenceTests(unittest.TestCase, TestBase):
     cluster_classes = [
         Cluster,
         OffsetRememberingCluster,
+        BlobCachingCluster,
         InMemoryCluster,
         ModifiableClusterWrapperHelper,
     ]
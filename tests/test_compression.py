@@ -129,6 +129,24 @@ class CompressionTests(unittest.TestCase, TestBase):
                 self.assertEqual(decompressor.unused_data, b"")
                 self.assertEqual(decompressed, raw_data)
 
+    def test_zstd_workers(self):
+        """
+        Test multi-threaded zstd compression.
+        """
+        if not CompressionRegistry.has(CompressionType.ZSTD):
+            self.skipTest("zstd not available")
+        raw_data = b"test hello world foo bar baz" * 1024 * 5
+        compression_interface = CompressionRegistry.get(CompressionType.ZSTD)
+        for option in (None, 3, {}):
+            options = {"zstd.workers": 2}
+            if option is not None:
+                options["zstd.option"] = option
+            compressor = compression_interface.get_compressor(options)
+            compressed = compressor.compress(raw_data)
+            compressed += compressor.flush()
+            decompressor = compression_interface.get_decompressor()
+            self.assertEqual(decompressor.decompress(compressed), raw_data)
+
     def test_decompressing_reader_read(self):
         """
         Test L{pyzim.compression.DecompressingReader.read}.
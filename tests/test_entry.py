@@ -511,6 +511,38 @@ class EntryTests(unittest.TestCase, TestBase):
             self.assertEqual(entry.parameters, loaded.parameters)
             self.assertEqual(entry.redirect_index, loaded.redirect_index)
 
+    def test_serialization_after_modification(self):
+        """
+        Test that serialization reflects changes to url and title.
+        """
+        entry = ContentEntry(
+            mimetype=0,
+            namespace="C",
+            revision=0,
+            cluster_number=1,
+            blob_number=2,
+            url="foo",
+            title="",
+            parameters=[],
+        )
+        dumped = entry.to_bytes()
+        self.assertEqual(len(dumped), entry.get_disk_size())
+        self.assertTrue(dumped.endswith(b"foo\x00\x00"))
+        # change url and title
+        entry.url = u"bär"
+        entry.title = b"Title"
+        dumped = entry.to_bytes()
+        self.assertEqual(len(dumped), entry.get_disk_size())
+        self.assertTrue(dumped.endswith(u"bär".encode(constants.ENCODING) + b"\x00Title\x00"))
+        loaded = ContentEntry.from_file(io.BytesIO(dumped))
+        self.assertEqual(loaded.url, u"bär")
+        self.assertEqual(loaded.title, "Title")
+        # remove title
+        entry.title = None
+        dumped = entry.to_bytes()
+        self.assertEqual(len(dumped), entry.get_disk_size())
+        self.assertTrue(dumped.endswith(u"bär".encode(constants.ENCODING) + b"\x00\x00"))
+
     def test_content_entry_remove(self):
         """
         Test L{pyzim.entry.ContentEntry.remove}.
@@ -59,6 +59,48 @@ class HeaderTests(unittest.TestCase, TestBase):
         with self.assertRaises(ValueError):
             header.from_bytes(dumped[:-1])
 
+    def test_to_bytes_buffer(self):
+        """
+        Test L{pyzim.header.Header.to_bytes} with a preallocated buffer.
+        """
+        header = Header.placeholder()
+        header.entry_count = 12
+        expected = header.to_bytes()
+        self.assertIsInstance(expected, bytes)
+        self.assertEqual(len(expected), Header.LENGTH)
+        buf = bytearray(Header.LENGTH + 4)
+        result = header.to_bytes(buf=buf, offset=2)
+        self.assertIs(result, buf)
+        self.assertEqual(bytes(buf[2:-2]), expected)
+        self.assertEqual(bytes(buf[:2]), b"\x00\x00")
+        self.assertEqual(bytes(buf[-2:]), b"\x00\x00")
+        parsed = Header.from_bytes(bytes(buf[2:-2]))
+        self.assertEqual(parsed.entry_count, 12)
+
+    def test_lazy_uuid(self):
+        """
+        Test that a header parsed from bytes correctly handles the uuid.
+        """
+        uuid_1 = uuid.uuid4()
+        header = Header.placeholder()
+        header.uuid = uuid_1
+        dumped = header.to_bytes()
+        parsed = Header.from_bytes(dumped)
+        # dumping must work without accessing the uuid first
+        self.assertEqual(parsed.to_bytes(), dumped)
+        self.assertEqual(parsed.uuid, uuid_1)
+        self.assertEqual(parsed.to_bytes(), dumped)
+        # changing the uuid must be reflected
+        uuid_2 = uuid.uuid4()
+        parsed = Header.from_bytes(dumped)
+        parsed.uuid = uuid_2
+        self.assertTrue(parsed.dirty)
+        self.assertEqual(Header.from_bytes(parsed.to_bytes()).uuid, uuid_2)
+        # setting the same uuid should not mark the header as dirty
+        parsed = Header.from_bytes(dumped)
+        parsed.uuid = uuid_1.bytes_le
+        self.assertFalse(parsed.dirty)
+
     def test_str(self):
         """
         Test L{pyzim.header.Header.__str__}.
@@ -120,6 +162,8 @@ class HeaderTests(unittest.TestCase, TestBase):
         self.assertEqual(placeholder.major_version, constants.ZIM_MAJOR_VERSION)
         self.assertEqual(placeholder.minor_version, constants.ZIM_MINOR_VERSION)
         self.assertIsInstance(placeholder.uuid, uuid.UUID)
+        # all attributes are kept in slots
+        self.assertFalse(hasattr(placeholder, "__dict__"))
 
     def test_properties(self):
         """
@@ -171,6 +215,11 @@ class HeaderTests(unittest.TestCase, TestBase):
             setattr(header, attr, 2)
             self.assertFalse(header.dirty)
             self.assertEqual(getattr(header, attr), 2)
+            # setting the previous value is a no-op, even when non-mutable
+            header.mutable = False
+            setattr(header, attr, 2)
+            self.assertFalse(header.dirty)
+            header.mutable = True
 
         # special property checks
         # uuid conversion
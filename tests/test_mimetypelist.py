@@ -55,6 +55,40 @@ class MimeTypeListTests(unittest.TestCase, TestBase):
         self.assertEqual(mimetypes.get(0), b"foo")
         self.assertFalse(mimetypes.dirty)
 
+    def test_parse_small_buffer(self):
+        """
+        Test parsing of a MIME type list using a tiny read buffer.
+        """
+        data = b"testfoo\x00bar\x00baz\x00\x00test"
+        for buffersize in (1, 2, 3, 5, 7, 64):
+            f = io.BytesIO(data)
+            mimetypes = MimeTypeList.from_file(f, seek=4, buffersize=buffersize)
+            self.assertListEqual(mimetypes._mimetypes, [b"foo", b"bar", b"baz"])
+            self.assertFalse(mimetypes.dirty)
+        # empty list
+        mimetypes = MimeTypeList.from_file(io.BytesIO(b"\x00test"), buffersize=1)
+        self.assertEqual(len(mimetypes), 0)
+        # unterminated list
+        with self.assertRaises(IOError):
+            MimeTypeList.from_file(io.BytesIO(b"foo\x00bar"))
+
+    def test_from_bytes(self):
+        """
+        Test L{pyzim.mimetypelist.MimeTypeList.from_bytes}.
+        """
+        mimetypes = MimeTypeList.from_bytes(b"foo\x00bar\x00\x00")
+        self.assertListEqual(mimetypes._mimetypes, [b"foo", b"bar"])
+        self.assertFalse(mimetypes.dirty)
+        mimetypes = MimeTypeList.from_bytes(b"\x00")
+        self.assertEqual(len(mimetypes), 0)
+        # missing end of list
+        with self.assertRaises(ValueError):
+            MimeTypeList.from_bytes(b"foo\x00bar")
+        with self.assertRaises(ValueError):
+            MimeTypeList.from_bytes(b"foo\x00bar\x00")
+        with self.assertRaises(ValueError):
+            MimeTypeList.from_bytes(b"")
+
     def test_to_bytes(self):
         """
         Test L{pyzim.mimetypelist.MimeTypeList.to_bytes}.
@@ -64,6 +98,13 @@ class MimeTypeListTests(unittest.TestCase, TestBase):
         self.assertEqual(len(dumped), mimetypes.get_disk_size())
         parsed = MimeTypeList.from_file(io.BytesIO(dumped))
         self.assertListEqual(mimetypes._mimetypes, parsed._mimetypes)
+        # an empty mimetype list only consists of the end byte
+        mimetypes = MimeTypeList([])
+        dumped = mimetypes.to_bytes()
+        self.assertEqual(dumped, b"\x00")
+        self.assertEqual(len(dumped), mimetypes.get_disk_size())
+        parsed = MimeTypeList.from_file(io.BytesIO(dumped))
+        self.assertEqual(len(parsed), 0)
 
     def test_get_index(self):
         """
@@ -123,6 +164,11 @@ class MimeTypeListTests(unittest.TestCase, TestBase):
         self.assertTrue(mimetypes.has("foo"))
         self.assertTrue(mimetypes.has("bar"))
         self.assertTrue(mimetypes.has("baz"))
+        # registered mimetypes should be retrievable by index, also decoded
+        self.assertEqual(mimetypes.get(0, as_unicode=True), "foo")
+        self.assertEqual(mimetypes.get(4, as_unicode=True), "test2")
+        self.assertEqual(mimetypes.get(4, as_unicode=True), "test2")
+        self.assertEqual(mimetypes.get(4), b"test2")
         # ensure failure on non-mutable
         mimetypes.dirty = False
         mimetypes.mutable = False
@@ -186,3 +232,19 @@ class MimeTypeListTests(unittest.TestCase, TestBase):
         for mimetypes_raw, expected in testdata:
             mimetypes = MimeTypeList(mimetypes_raw)
             self.assertEqual(mimetypes.get_disk_size(), expected)
+
+    def test_cache_invalidation(self):
+        """
+        Test that cached sizes and dumps are updated when registering mimetypes.
+        """
+        mimetypes = MimeTypeList([b"foo"])
+        self.assertEqual(mimetypes.get_disk_size(), 5)
+        self.assertEqual(mimetypes.to_bytes(), b"foo\x00\x00")
+        # registering an existing mimetype should not change anything
+        mimetypes.register(b"foo")
+        self.assertEqual(mimetypes.get_disk_size(), 5)
+        self.assertEqual(mimetypes.to_bytes(), b"foo\x00\x00")
+        # registering a new mimetype must be reflected
+        mimetypes.register(b"bar")
+        self.assertEqual(mimetypes.get_disk_size(), 9)
+        self.assertEqual(mimetypes.to_bytes(), b"foo\x00bar\x00\x00")
@@ -4,7 +4,7 @@ Tests for L{pyzim.modifiable}.
 """
 import unittest
 
-from pyzim.modifiable import ModifiableMixIn
+from pyzim.modifiable import ModifiableMixIn, cached_disk_size
 
 from .base import TestBase
 
@@ -54,6 +54,21 @@ class SomeOtherModifiable(ModifiableMixIn):
         ModifiableMixIn.__init__(self)
 
 
+class CachingModifiable(SomeModifiable):
+    """
+    A subclass of L{SomeModifiable} that caches the disk size.
+
+    @ivar n_calculations: number of times the disk size has been calculated
+    @type n_calculations: L{int}
+    """
+    n_calculations = 0
+
+    @cached_disk_size
+    def get_disk_size(self):
+        self.n_calculations += 1
+        return len(self.s)
+
+
 class ModifiableTests(unittest.TestCase, TestBase):
     """
     Tests for L{pyzim.modifiable.ModifiableMixIn} and its subclasses.
@@ -149,6 +164,50 @@ class ModifiableTests(unittest.TestCase, TestBase):
         with self.assertRaises(TypeError):
             root.remove_submodifiable(object())
 
+    def test_nested_submodifiables(self):
+        """
+        Test that dirty states propagate through multiple levels of submodifiables.
+        """
+        root = SomeModifiable()
+        child = SomeModifiable()
+        grandchildren = [SomeModifiable() for i in range(3)]
+        root.add_submodifiable(child)
+        for grandchild in grandchildren:
+            child.add_submodifiable(grandchild)
+        self.assertFalse(root.dirty)
+
+        # marking multiple grandchildren as dirty
+        grandchildren[0].mark_dirty()
+        grandchildren[1].mark_dirty()
+        self.assertTrue(child.dirty)
+        self.assertTrue(root.dirty)
+        # the root should stay dirty until all grandchildren are clean
+        grandchildren[0].dirty = False
+        self.assertTrue(root.dirty)
+        grandchildren[1].dirty = False
+        self.assertFalse(child.dirty)
+        self.assertFalse(root.dirty)
+
+        # adding an already dirty child should make the parents dirty
+        new_grandchild = SomeModifiable()
+        new_grandchild.mark_dirty()
+        child.add_submodifiable(new_grandchild)
+        self.assertTrue(root.dirty)
+        new_grandchild.dirty = False
+        self.assertFalse(root.dirty)
+
+        # a child with multiple parents should inform all of them
+        other_root = SomeModifiable()
+        other_root.add_submodifiable(child)
+        grandchildren[2].mark_dirty()
+        self.assertTrue(root.dirty)
+        self.assertTrue(other_root.dirty)
+        root.remove_submodifiable(child)
+        self.assertFalse(root.dirty)
+        self.assertTrue(other_root.dirty)
+        grandchildren[2].dirty = False
+        self.assertFalse(other_root.dirty)
+
     def test_get_disk_size(self):
         """
         Test L{pyzim.modifiable.ModifiableMixIn.get_disk_size}.
@@ -159,6 +218,29 @@ class ModifiableTests(unittest.TestCase, TestBase):
         with self.assertRaises(NotImplementedError):
             m.get_disk_size()
 
+    def test_cached_disk_size(self):
+        """
+        Test L{pyzim.modifiable.cached_disk_size}.
+        """
+        m = CachingModifiable("test")
+        self.assertEqual(m.get_disk_size(), 4)
+        self.assertEqual(m.get_disk_size(), 4)
+        self.assertEqual(m.n_calculations, 1)
+        # marking the object as dirty invalidates the cache
+        m.set_s("foo")
+        self.assertEqual(m.get_disk_size(), 3)
+        self.assertEqual(m.n_calculations, 2)
+        # as does each subsequent modification, even if already dirty
+        m.s = "foobar"
+        m.mark_dirty()
+        self.assertEqual(m.get_disk_size(), 6)
+        self.assertEqual(m.n_calculations, 3)
+        # flushing does not invalidate the cache
+        m.after_flush_or_read()
+        self.assertEqual(m.get_unmodified_disk_size(), 6)
+        self.assertEqual(m.get_disk_size(), 6)
+        self.assertEqual(m.n_calculations, 3)
+
     def test_after_flush_or_read(self):
         """
         Test L{pyzim.modifiable.ModifiableMixIn.after_flush_or_read}.
@@ -6,13 +6,103 @@ import struct
 import unittest
 from unittest import mock
 
-from pyzim.pointerlist import SimplePointerList, OrderedPointerList, TitlePointerList
+from pyzim.pointerlist import SimplePointerList, OrderedPointerList, TitlePointerList, read_pointers, binarysearch
+from pyzim.pointerlist import get_bulk_pointer_struct
 from pyzim.pointerlist import OnDiskSimplePointerList, OnDiskOrderedPointerList, OnDiskTitlePointerList
 from pyzim import constants, exceptions
 
 from .base import TestBase
 
 
+class HelperTests(unittest.TestCase):
+    """
+    Tests for the helper functions in L{pyzim.pointerlist}.
+    """
+    def test_binarysearch(self):
+        """
+        Test L{pyzim.pointerlist.binarysearch}.
+        """
+        data = [1, 3, 3, 5, 7]
+        calls = []
+
+        def key(v):
+            calls.append(v)
+            return v * 10
+
+        self.assertEqual(binarysearch(data, 0, key=key), 0)
+        self.assertEqual(binarysearch(data, 30, key=key), 1)
+        self.assertEqual(binarysearch(data, 40, key=key), 3)
+        self.assertEqual(binarysearch(data, 80, key=key), 5)
+        self.assertEqual(binarysearch(data, 10, key=key, start=2), 2)
+        self.assertEqual(binarysearch(data, 80, key=key, start=1, end=3), 3)
+        self.assertEqual(binarysearch([], 1, key=key), 0)
+        # the key function should only be called for few elements
+        calls.clear()
+        binarysearch(list(range(1024)), 500, key=key)
+        self.assertLessEqual(len(calls), 11)
+
+    def test_get_bulk_pointer_struct(self):
+        """
+        Test L{pyzim.pointerlist.get_bulk_pointer_struct}.
+        """
+        data = [1, 2, 3]
+        bulk_struct = get_bulk_pointer_struct("I", len(data))
+        self.assertIs(bulk_struct, get_bulk_pointer_struct("I", len(data)))
+        packed = bulk_struct.pack(*data)
+        self.assertEqual(packed, struct.pack(constants.ENDIAN + "III", *data))
+        self.assertEqual(list(bulk_struct.unpack(packed)), data)
+        self.assertEqual(get_bulk_pointer_struct("Q", 0).size, 0)
+
+    def test_read_pointers(self):
+        """
+        Test L{pyzim.pointerlist.read_pointers}.
+        """
+        data = [0, 1, 2**31, 2**32 - 1]
+        for pointer_format in ("I", "Q"):
+            raw = struct.pack(constants.ENDIAN + pointer_format * len(data), *data)
+            f = io.BytesIO(b"test" + raw + b"test")
+            f.seek(4)
+            self.assertEqual(list(read_pointers(f, len(data), pointer_format)), data)
+            self.assertEqual(f.read(), b"test")
+            # reading 0 pointers should work
+            self.assertEqual(list(read_pointers(io.BytesIO(raw), 0, pointer_format)), [])
+            # check error on EOF
+            with self.assertRaises(IOError):
+                read_pointers(io.BytesIO(raw[:-1]), len(data), pointer_format)
+
+    def test_read_pointers_no_array(self):
+        """
+        Test L{pyzim.pointerlist.read_pointers} when no array typecode is available.
+        """
+        data = [10, 20, 2**32]
+        raw = struct.pack(constants.ENDIAN + "Q" * len(data), *data)
+        with mock.patch("pyzim.pointerlist.get_array_typecode", return_value=None):
+            pointers = read_pointers(io.BytesIO(raw), len(data), "Q")
+            self.assertEqual(pointers, data)
+            # the list fallback should also be used when dumping
+            pointerlist = SimplePointerList(pointers)
+            self.assertIsInstance(pointerlist._pointers, list)
+            self.assertEqual(pointerlist.to_bytes(), raw)
+            buf = bytearray(len(raw) + 2)
+            pointerlist.to_bytes(buf, offset=2)
+            self.assertEqual(bytes(buf[2:]), raw)
+            with self.assertRaises(IOError):
+                read_pointers(io.BytesIO(raw[:-1]), len(data), "Q")
+
+    def test_read_pointers_no_readinto(self):
+        """
+        Test L{pyzim.pointerlist.read_pointers} with a file-like object without readinto().
+        """
+        data = [10, 20, 30]
+        raw = struct.pack(constants.ENDIAN + "Q" * len(data), *data)
+        f = mock.Mock(spec=["read"])
+        f.read.return_value = raw
+        self.assertEqual(list(read_pointers(f, len(data), "Q")), data)
+        f.read.return_value = raw[:-1]
+        with self.assertRaises(IOError):
+            read_pointers(f, len(data), "Q")
+
+
 class SimplePointerListTests(unittest.TestCase, TestBase):
     """
     Tests for L{pyzim.pointerlist.SimplePointerlist}.
@@ -27,7 +117,7 @@ class SimplePointerListTests(unittest.TestCase, TestBase):
         """
         pointerlist = SimplePointerList.new()
         self.assertEqual(len(pointerlist), 0)
-        self.assertEqual(pointerlist._pointers, [])
+        self.assertEqual(list(pointerlist._pointers), [])
 
     def test_simple_read(self):
         """
@@ -81,7 +171,61 @@ class SimplePointerListTests(unittest.TestCase, TestBase):
         dumped = pointerlist.to_bytes()
         self.assertEqual(len(dumped), pointerlist.get_disk_size())
         parsed = SimplePointerList.from_bytes(dumped)
-        self.assertListEqual(pointerlist._pointers, parsed._pointers)
+        self.assertListEqual(list(pointerlist._pointers), list(parsed._pointers))
+        # dump into a buffer
+        buf = bytearray(len(dumped) + 2)
+        self.assertIs(pointerlist.to_bytes(buf=buf, offset=1), buf)
+        self.assertEqual(bytes(buf[1:-1]), dumped)
+        self.assertEqual(buf[0], 0)
+        self.assertEqual(buf[-1], 0)
+        # parse from a buffer
+        parsed = SimplePointerList.from_bytes(memoryview(buf)[1:-1])
+        self.assertListEqual(list(pointerlist._pointers), list(parsed._pointers))
+
+    def test_byteswap(self):
+        """
+        Test serialization when the ZIM byte order differs from the native one.
+        """
+        data = [1, 2**16, 2**40]
+        native = struct.pack("=" + SimplePointerList.POINTER_FORMAT * len(data), *data)
+        swapped = b"".join(native[i:i + 8][::-1] for i in range(0, len(native), 8))
+        with mock.patch("pyzim.pointerlist.needs_byteswap", return_value=True):
+            pointerlist = SimplePointerList(data)
+            self.assertEqual(pointerlist.to_bytes(), swapped)
+            buf = bytearray(len(swapped))
+            pointerlist.to_bytes(buf)
+            self.assertEqual(bytes(buf), swapped)
+            self.assertEqual(list(pointerlist.iter_pointers()), data)
+            parsed = SimplePointerList.from_bytes(swapped)
+            self.assertEqual(list(parsed.iter_pointers()), data)
+            self.assertEqual(list(read_pointers(io.BytesIO(swapped), len(data), "Q")), data)
+
+    def test_write_to(self):
+        """
+        Test L{pyzim.pointerlist.SimplePointerList.write_to}.
+        """
+        pointerlist = SimplePointerList(list(range(100, 200)))
+        dumped = pointerlist.to_bytes()
+        f = io.BytesIO()
+        self.assertEqual(pointerlist.write_to(f), len(dumped))
+        self.assertEqual(f.getvalue(), dumped)
+        # check the chunked code paths
+        with mock.patch("pyzim.pointerlist.needs_byteswap", return_value=True):
+            swapped = pointerlist.to_bytes()
+            f = io.BytesIO()
+            self.assertEqual(pointerlist.write_to(f, chunksize=7), len(swapped))
+            self.assertEqual(f.getvalue(), swapped)
+            # the pointers themselves must not have been modified
+            self.assertEqual(list(pointerlist._pointers), list(range(100, 200)))
+        with mock.patch("pyzim.pointerlist.get_array_typecode", return_value=None):
+            pointerlist = SimplePointerList(list(range(100, 200)))
+            f = io.BytesIO()
+            self.assertEqual(pointerlist.write_to(f, chunksize=7), len(dumped))
+            self.assertEqual(f.getvalue(), dumped)
+        # empty pointer lists should write nothing
+        f = io.BytesIO()
+        self.assertEqual(SimplePointerList.new().write_to(f), 0)
+        self.assertEqual(f.getvalue(), b"")
 
     def test_from_bytes_incomplete(self):
         """
@@ -116,6 +260,11 @@ class SimplePointerListTests(unittest.TestCase, TestBase):
             self.assertEqual(len(pointers), rl_end - rl_start)
             for p_a, p_b in zip(pointers, self.data[rl_start:rl_end]):
                 self.assertEqual(p_a, p_b)
+        # the pointer list can be modified while iterating
+        iterator = pointerlist.iter_pointers()
+        self.assertEqual(next(iterator), self.data[0])
+        pointerlist.append(100)
+        self.assertEqual(list(iterator), self.data[1:])
 
     def test_get_by_pointer(self):
         """
@@ -128,6 +277,54 @@ class SimplePointerListTests(unittest.TestCase, TestBase):
         self.assertEqual(pointerlist.get_by_pointer(50), 4)
         with self.assertRaises(KeyError):
             pointerlist.get_by_pointer(35)
+        # repeated lookups should use the reverse index
+        for i, pointer in enumerate(pointers):
+            self.assertEqual(pointerlist.get_by_pointer(pointer), i)
+        with self.assertRaises(KeyError):
+            pointerlist.get_by_pointer(35)
+        # modifications must invalidate the reverse index
+        pointerlist.append(60)
+        self.assertEqual(pointerlist.get_by_pointer(60), 5)
+        self.assertEqual(pointerlist.get_by_pointer(60), 5)
+        pointerlist.set(0, 35)
+        self.assertEqual(pointerlist.get_by_pointer(35), 0)
+        self.assertEqual(pointerlist.get_by_pointer(35), 0)
+        with self.assertRaises(KeyError):
+            pointerlist.get_by_pointer(10)
+        pointerlist.remove_by_index(0)
+        self.assertEqual(pointerlist.get_by_pointer(20), 0)
+        self.assertEqual(pointerlist.get_by_pointer(20), 0)
+        # duplicate pointers should return the first index
+        pointerlist = SimplePointerList([10, 20, 10, 20])
+        for _ in range(3):
+            self.assertEqual(pointerlist.get_by_pointer(10), 0)
+            self.assertEqual(pointerlist.get_by_pointer(20), 1)
+        # a modification while building the reverse index must not leave a stale index behind
+        pointerlist = SimplePointerList([10, 20, 30])
+
+        class _ModifyingList(list):
+            """
+            A list that removes its first pointer while being iterated in reverse once.
+            """
+            modify = True
+
+            def __reversed__(self):
+                result = list.__reversed__(self)
+                if self.modify:
+                    self.modify = False
+                    pointerlist.remove_by_index(0)
+                return result
+
+        pointerlist._pointers = _ModifyingList(pointerlist._pointers)
+        self.assertEqual(pointerlist.get_by_pointer(30), 2)
+        # builds the index, modifying the list
+        self.assertEqual(pointerlist.get_by_pointer(30), 1)
+        self.assertIsNone(pointerlist._reverse_index)
+        self.assertEqual(pointerlist.get_by_pointer(20), 0)
+        self.assertEqual(pointerlist.get_by_pointer(20), 0)
+        self.assertEqual(pointerlist.get_by_pointer(30), 1)
+        with self.assertRaises(KeyError):
+            pointerlist.get_by_pointer(10)
 
     def test_modify(self):
         """
@@ -178,6 +375,26 @@ class SimplePointerListTests(unittest.TestCase, TestBase):
         self.assertFalse(pointerlist.dirty)
         self.assertEqual(pointerlist.get_by_index(1), 1000)
 
+    def test_extend(self):
+        """
+        Test L{pyzim.pointerlist.SimplePointerList.extend}.
+        """
+        pointerlist = SimplePointerList.from_bytes(self.rawlist)
+        pointerlist.extend([])
+        self.assertFalse(pointerlist.dirty)
+        self.assertEqual(len(pointerlist), 6)
+        pointerlist.extend([100, 200])
+        self.assertTrue(pointerlist.dirty)
+        pointerlist.extend(p for p in (300, 400))
+        self.assertEqual(list(pointerlist.iter_pointers()), self.data + [100, 200, 300, 400])
+        # ensure an error will be raised if not mutable
+        pointerlist.mutable = False
+        pointerlist.dirty = False
+        with self.assertRaises(exceptions.NonMutable):
+            pointerlist.extend([500])
+        self.assertFalse(pointerlist.dirty)
+        self.assertEqual(len(pointerlist), 10)
+
     def test_remove_by_index(self):
         """
         Test L{pyzim.pointerlist.SimplePointerList.remove_by_index}.
@@ -376,6 +593,32 @@ class OrderedPointerListTests(unittest.TestCase, TestBase):
         pointerlist.check_sorted()
         self.assertTrue(pointerlist.has("a"))
 
+    def test_add_many(self):
+        """
+        Test L{pyzim.pointerlist.OrderedPointerList.add_many}.
+        """
+        pointerlist = OrderedPointerList.from_bytes(self.rawlist, key_func=self.keyfunc)
+        pointerlist.add_many([])
+        self.assertFalse(pointerlist.dirty)
+        self.data.extend([b"d", b"0", b"z"])
+        pointerlist.add_many([(u"d", 6), (b"0", 7), (b"z", 8)])
+        self.assertTrue(pointerlist.dirty)
+        self.assertEqual(len(pointerlist), 9)
+        pointerlist.check_sorted()
+        self.assertEqual(pointerlist.get(b"0"), 7)
+        self.assertEqual(pointerlist.get_by_index(0), 7)
+        self.assertEqual(pointerlist.get(u"d"), 6)
+        self.assertEqual(pointerlist.get(b"e"), 3)
+        self.assertEqual(pointerlist.get_by_index(8), 8)
+        self.assertEqual(list(pointerlist.iter_values()), sorted(self.data))
+        # ensure an error is raised when the list is not mutable
+        pointerlist.mutable = False
+        pointerlist.dirty = False
+        with self.assertRaises(exceptions.NonMutable):
+            pointerlist.add_many([(b"y", 9)])
+        self.assertFalse(pointerlist.dirty)
+        self.assertFalse(pointerlist.has(b"y"))
+
     def test_add_remove_unicode(self):
         """
         Test adding and removing of elements with unicode.
@@ -414,7 +657,7 @@ class OrderedPointerListTests(unittest.TestCase, TestBase):
         pointerlist = OrderedPointerList.from_bytes(self.rawlist, key_func=self.keyfunc)
         dumped = pointerlist.to_bytes()
         parsed = OrderedPointerList.from_bytes(dumped, key_func=self.keyfunc)
-        self.assertListEqual(pointerlist._pointers, parsed._pointers)
+        self.assertListEqual(list(pointerlist._pointers), list(parsed._pointers))
 
     def test_check_sorted(self):
         """
@@ -432,6 +675,9 @@ class OrderedPointerListTests(unittest.TestCase, TestBase):
         # check that check_sorted() on unsorted list does not pass
         with self.assertRaises(exceptions.UnsortedList):
             unsorted_pointerlist.check_sorted()
+        # check that check_sorted() passes on empty and single-element lists
+        OrderedPointerList.new(key_func=self.keyfunc).check_sorted()
+        OrderedPointerList([2], key_func=self.keyfunc).check_sorted()
 
     def test_from_bytes_incomplete(self):
         """
@@ -451,6 +697,91 @@ class OrderedPointerListTests(unittest.TestCase, TestBase):
         self.assertEqual(pointerlist.find_first_greater_equals("b"), 1)
         self.assertEqual(self.data[pointerlist.find_first_greater_equals("e"):], [b"e", b"f", b"g"])
 
+    def test_key_cache(self):
+        """
+        Test that keys of L{pyzim.pointerlist.OrderedPointerList} are cached.
+        """
+        calls = []
+
+        def counting_keyfunc(pointer):
+            calls.append(pointer)
+            return self.keyfunc(pointer)
+
+        pointerlist = OrderedPointerList.from_bytes(self.rawlist, key_func=counting_keyfunc)
+        for _ in range(3):
+            for key in self.data:
+                self.assertEqual(pointerlist.get(key), self.data.index(key))
+        self.assertEqual(sorted(calls), sorted(set(calls)))
+        # keys must stay consistent when modifying the list
+        pointerlist.add(b"d", 6)
+        self.data.append(b"d")
+        self.assertEqual(pointerlist.get(b"d"), 6)
+        self.assertEqual(pointerlist.get(b"e"), 3)
+        pointerlist.check_sorted()
+        pointerlist.remove(b"b")
+        self.assertFalse(pointerlist.has(b"b"))
+        self.assertEqual(pointerlist.get(b"c"), 2)
+        pointerlist.check_sorted()
+        # mass_update() changes pointers and thus invalidates keys
+        self.data.insert(0, b"0")
+        pointerlist.mass_update(1)
+        self.assertEqual(pointerlist.get(b"a"), 1)
+        self.assertEqual(pointerlist.get(b"d"), 7)
+        pointerlist.check_sorted()
+        # clear_key_cache() forces keys to be recomputed
+        self.data[1] = b"_"
+        self.assertTrue(pointerlist.has(b"a"))
+        pointerlist.clear_key_cache()
+        self.assertFalse(pointerlist.has(b"a"))
+        self.assertTrue(pointerlist.has(b"_"))
+
+    def test_precompute_keys(self):
+        """
+        Test L{pyzim.pointerlist.OrderedPointerList.precompute_keys}.
+        """
+        calls = []
+
+        def counting_keyfunc(pointer):
+            calls.append(pointer)
+            return self.keyfunc(pointer)
+
+        pointerlist = OrderedPointerList.from_bytes(self.rawlist, key_func=counting_keyfunc)
+        pointerlist.precompute_keys()
+        n_calls = len(self.data)
+        self.assertEqual(len(calls), n_calls)
+        # lookups should no longer require the key function
+        self.assertEqual(pointerlist.get(b"c"), 2)
+        self.assertFalse(pointerlist.has(b"d"))
+        pointerlist.add(b"d", 6)
+        self.data.append(b"d")
+        self.assertEqual(pointerlist.get(b"d"), 6)
+        pointerlist.remove(b"a")
+        self.assertFalse(pointerlist.has(b"a"))
+        self.assertEqual(len(calls), n_calls)
+        # appending pointers with unknown keys requires the key function again
+        self.data.append(b"z")
+        pointerlist.append(7)
+        self.assertEqual(pointerlist.get(b"z"), 7)
+        self.assertGreater(len(calls), n_calls)
+        pointerlist.check_sorted()
+
+    def test_title_pointer_list_mass_update_keeps_keys(self):
+        """
+        Test that L{pyzim.pointerlist.TitlePointerList.mass_update} keeps the cached keys.
+        """
+        titles = [b"a", b"b", b"c"]
+        pointerlist = TitlePointerList([0, 1, 2], key_func=lambda p: titles[p])
+        pointerlist.precompute_keys()
+        # simulate an entry being inserted at URL index 1
+        titles.insert(1, b"x")
+        pointerlist.mass_update(1, start=1)
+        self.assertEqual(list(pointerlist.iter_pointers()), [0, 2, 3])
+        self.assertEqual(pointerlist.get(b"b"), 2)
+        self.assertEqual(pointerlist.get(b"c"), 3)
+        pointerlist.add(b"x", 1)
+        self.assertEqual(pointerlist.get(b"x"), 1)
+        pointerlist.check_sorted()
+
     def test_iter_values(self):
         """
         Test L{pyzim.pointerlist.OrderedPointerList.iter_values}.
@@ -477,6 +808,36 @@ class OrderedPointerListTests(unittest.TestCase, TestBase):
             self.assertEqual(len(values), rl_end - rl_start)
             for v_a, v_b in zip(values, self.data[rl_start:rl_end]):
                 self.assertEqual(v_a, v_b)
+            # same values once all keys are cached
+            pointerlist.precompute_keys()
+            self.assertEqual(list(pointerlist.iter_values(start, end)), values)
+            pointerlist.clear_key_cache()
+
+
+def _make_on_disk_pointerlist(cls, pointers, key_func=None, offset=0):
+    """
+    Create an on-disk pointer list backed by an in-memory file instead of a ZIM.
+
+    @param cls: on-disk pointer list class to instantiate
+    @type cls: L{type}
+    @param pointers: pointers to store in the file
+    @type pointers: L{list} of L{int}
+    @param key_func: if specified, key function to pass to the pointer list
+    @type key_func: callable or L{None}
+    @param offset: number of padding bytes before the pointers in the file
+    @type offset: L{int}
+    @return: the pointer list
+    @rtype: L{pyzim.pointerlist.OnDiskSimplePointerList}
+    """
+    raw = struct.pack(constants.ENDIAN + cls.POINTER_FORMAT * len(pointers), *pointers)
+    f = io.BytesIO(b"\x00" * offset + raw)
+    zim = mock.Mock()
+    zim.acquire_file.return_value.__enter__ = mock.Mock(return_value=f)
+    zim.acquire_file.return_value.__exit__ = mock.Mock(return_value=False)
+    kwargs = {}
+    if key_func is not None:
+        kwargs["key_func"] = key_func
+    return cls.from_zim_file(zim, n=len(pointers), seek=offset, **kwargs)
 
 
 class OnDiskSimplePointerListTests(unittest.TestCase, TestBase):
@@ -515,6 +876,23 @@ class OnDiskSimplePointerListTests(unittest.TestCase, TestBase):
             pointerlist = OnDiskSimplePointerList.from_zim_file(zim, n=zim.header.cluster_count)
             self.assertEqual(pointerlist.get_by_index(entry.cluster_number), cluster.offset)
 
+    def test_iter_pointers(self):
+        """
+        Test L{pyzim.pointerlist.OnDiskSimplePointerList.iter_pointers}.
+        """
+        data = list(range(1000, 1100))
+        pointerlist = _make_on_disk_pointerlist(OnDiskSimplePointerList, data, offset=4)
+        with mock.patch.object(pointerlist, "ITER_CHUNK_SIZE", 7):
+            self.assertEqual(list(pointerlist.iter_pointers()), data)
+            self.assertEqual(list(pointerlist.iter_pointers(3, 50)), data[3:50])
+            self.assertEqual(list(pointerlist.iter_pointers(10, 10)), [])
+        self.assertEqual(list(pointerlist.iter_pointers(95)), data[95:])
+        self.assertEqual(pointerlist.get_by_index(42), data[42])
+        self.assertEqual(pointerlist.get_by_pointer(1042), 42)
+        self.assertEqual(pointerlist.get_by_pointer(1099), 99)
+        with self.assertRaises(KeyError):
+            pointerlist.get_by_pointer(2000)
+
     def test_from_zim_entry(self):
         """
         Test L{pyzim.pointerlist.OnDiskSimplePointerList.from_zim_entry}
@@ -548,6 +926,60 @@ class OnDiskOrderedPointerListTests(unittest.TestCase, TestBase):
                 with zim.acquire_file() as f:
                     OnDiskOrderedPointerList.from_file(f, zim.header.entry_count, seek=zim.header.cluster_pointer_position, key_func=lambda x: 0)
 
+    def test_iter_values(self):
+        """
+        Test L{pyzim.pointerlist.OnDiskOrderedPointerList.iter_values}.
+        """
+        data = list(range(100, 150))
+        pointerlist = _make_on_disk_pointerlist(OnDiskOrderedPointerList, data, key_func=lambda p: str(p).encode("ascii"))
+        values = [str(p).encode("ascii") for p in data]
+        self.assertEqual(list(pointerlist.iter_values()), values)
+        self.assertEqual(list(pointerlist.iter_values(5, 20)), values[5:20])
+        self.assertEqual(list(pointerlist.iter_values(20, 20)), [])
+
+    def test_key_cache(self):
+        """
+        Test the key cache of L{pyzim.pointerlist.OnDiskOrderedPointerList}.
+        """
+        data = list(range(100, 150))
+        key_func = mock.Mock(side_effect=lambda p: str(p).encode("ascii"))
+        # limit the cache so that not all keys fit, but those of a single lookup do
+        with mock.patch.object(OnDiskOrderedPointerList, "KEY_CACHE_SIZE", 8):
+            pointerlist = _make_on_disk_pointerlist(OnDiskOrderedPointerList, data, key_func=key_func)
+        self.assertEqual(pointerlist.get(b"120"), 120)
+        n_calls = key_func.call_count
+        self.assertGreater(n_calls, 0)
+        # repeated lookups should use the cached keys
+        self.assertEqual(pointerlist.get(b"120"), 120)
+        self.assertTrue(pointerlist.has(b"120"))
+        self.assertEqual(key_func.call_count, n_calls)
+        # clearing the cache should cause the keys to be read again
+        pointerlist.clear_key_cache()
+        self.assertFalse(pointerlist.has(b"999"))
+        self.assertEqual(pointerlist.get(b"120"), 120)
+        self.assertGreater(key_func.call_count, n_calls)
+        # the amount of cached keys is limited
+        for pointer in data:
+            self.assertEqual(pointerlist.get(str(pointer).encode("ascii")), pointer)
+        self.assertEqual(pointerlist._cached_get_key.cache_info().currsize, 8)
+
+    def test_check_sorted(self):
+        """
+        Test L{pyzim.pointerlist.OnDiskOrderedPointerList.check_sorted}.
+        """
+        data = list(range(100, 150))
+        key_func = mock.Mock(side_effect=lambda p: str(p).encode("ascii"))
+        pointerlist = _make_on_disk_pointerlist(OnDiskOrderedPointerList, data, key_func=key_func)
+        with mock.patch.object(pointerlist, "ITER_CHUNK_SIZE", 16):
+            pointerlist.check_sorted()
+        # each key should have been determined exactly once, without filling the key cache
+        self.assertEqual(key_func.call_count, len(data))
+        self.assertEqual(pointerlist._cached_get_key.cache_info().currsize, 0)
+        # unsorted keys
+        pointerlist = _make_on_disk_pointerlist(OnDiskOrderedPointerList, data, key_func=lambda p: str(999 - p).encode("ascii"))
+        with self.assertRaises(exceptions.UnsortedList):
+            pointerlist.check_sorted()
+
     def test_from_zim_file(self):
         """
         Test L{pyzim.pointerlist.OnDiskOrderedPointerList.from_zim_file}
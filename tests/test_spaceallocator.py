@@ -77,6 +77,28 @@ class SpaceAllocatorTests(unittest.TestCase, TestBase):
         self.assertIn((64, 2), sa.free_blocks)
         self.assertIn((5, 32), sa.free_blocks)
 
+    def test_mark_free_merge_multiple(self):
+        """
+        Test marking an area as free that spans multiple free sections.
+        """
+        sa = SpaceAllocator(file_end=128)
+        sa.mark_free(40, 2)
+        sa.mark_free(10, 2)
+        sa.mark_free(20, 2)
+        sa.mark_free(30, 2)
+        sa.mark_free(50, 2)
+        self.assertEqual(sa.free_blocks, [(10, 2), (20, 2), (30, 2), (40, 2), (50, 2)])
+        # overlap the end of one block, swallow two and touch the start of another
+        sa.mark_free(11, 29)
+        self.assertEqual(sa.free_blocks, [(10, 32), (50, 2)])
+        # a section contained within a free section should not change anything
+        sa.mark_free(12, 4)
+        self.assertEqual(sa.free_blocks, [(10, 32), (50, 2)])
+        # sections before the first and after the last block
+        sa.mark_free(0, 2)
+        sa.mark_free(60, 2)
+        self.assertEqual(sa.free_blocks, [(0, 2), (10, 32), (50, 2), (60, 2)])
+
     def test_allocate(self):
         """
         Test L{pyzim.spaceallocator.SpaceAllocator.allocate}.
@@ -2,10 +2,11 @@
 Tests for L{pyzim.util.ioutil}.
 """
 import io
+import os
 import unittest
 
 from pyzim import constants
-from pyzim.util.ioutil import read_until_zero, read_n_bytes
+from pyzim.util.ioutil import read_until_zero, read_n_bytes, READ_UNTIL_ZERO_CHUNK_SIZE
 
 from ..base import TestBase
 
@@ -30,9 +31,7 @@ class IoUtilTests(unittest.TestCase, TestBase):
         self.assertEqual(read_b, substr_b)
         self.assertIsInstance(read_b, bytes)
         # read with 0
-        # NOTE: for some reason f.seek(0) does not work.
-        # so instead, we need to create a new instance of BytesIO
-        f = io.BytesIO(data)
+        f.seek(0)
         read_a = read_until_zero(f, strip_zero=False)
         self.assertEqual(read_a, substr_a + b"\x00")
         self.assertIsInstance(read_a, bytes)
@@ -40,7 +39,7 @@ class IoUtilTests(unittest.TestCase, TestBase):
         self.assertEqual(read_b, substr_b + b"\x00")
         self.assertIsInstance(read_b, bytes)
         # read explicitly without 0
-        f = io.BytesIO(data)
+        f.seek(0)
         read_a = read_until_zero(f, strip_zero=True)
         self.assertEqual(read_a, substr_a)
         self.assertIsInstance(read_a, bytes)
@@ -48,7 +47,7 @@ class IoUtilTests(unittest.TestCase, TestBase):
         self.assertEqual(read_b, substr_b)
         self.assertIsInstance(read_b, bytes)
         # read unicode
-        f = io.BytesIO(data)
+        f.seek(0)
         read_a = read_until_zero(f, encoding=constants.ENCODING)
         self.assertEqual(read_a, substr_a.decode(constants.ENCODING))
         self.assertIsInstance(read_a, str)
@@ -56,7 +55,7 @@ class IoUtilTests(unittest.TestCase, TestBase):
         self.assertEqual(read_b, substr_b.decode(constants.ENCODING))
         self.assertIsInstance(read_b, str)
         # read unicode with 0
-        f = io.BytesIO(data)
+        f.seek(0)
         read_a = read_until_zero(f, strip_zero=False, encoding=constants.ENCODING)
         self.assertEqual(read_a[:-1], substr_a.decode(constants.ENCODING))
         self.assertIsInstance(read_a, str)
@@ -64,6 +63,44 @@ class IoUtilTests(unittest.TestCase, TestBase):
         self.assertEqual(read_b[:-1], substr_b.decode(constants.ENCODING))
         self.assertIsInstance(read_b, str)
 
+    def test_read_until_zero_chunked(self):
+        """
+        Test L{pyzim.ioutil.read_until_zero} with strings spanning multiple chunks.
+        """
+        long_a = b"a" * (READ_UNTIL_ZERO_CHUNK_SIZE * 2 + 3)
+        long_b = b"b" * READ_UNTIL_ZERO_CHUNK_SIZE
+        data = long_a + b"\x00" + long_b + b"\x00" + b"c\x00"
+        f = io.BytesIO(data)
+        self.assertEqual(read_until_zero(f), long_a)
+        self.assertEqual(f.tell(), len(long_a) + 1)
+        self.assertEqual(read_until_zero(f, strip_zero=False), long_b + b"\x00")
+        self.assertEqual(read_until_zero(f), b"c")
+        self.assertEqual(f.tell(), len(data))
+
+    def test_read_until_zero_unseekable(self):
+        """
+        Test L{pyzim.ioutil.read_until_zero} with a non-seekable file.
+        """
+        r, w = os.pipe()
+        with open(r, "rb", buffering=0) as fin:
+            with open(w, "wb") as fout:
+                fout.write(b"foo\x00bar\x00")
+            self.assertFalse(fin.seekable())
+            self.assertEqual(read_until_zero(fin), b"foo")
+            self.assertEqual(read_until_zero(fin), b"bar")
+
+    def test_read_until_zero_eof(self):
+        """
+        Test L{pyzim.ioutil.read_until_zero} on a string without a terminating zero.
+        """
+        f = io.BytesIO(b"foo\x00bar")
+        self.assertEqual(read_until_zero(f), b"foo")
+        with self.assertRaises(IOError):
+            read_until_zero(f)
+        f = io.BytesIO(b"")
+        with self.assertRaises(IOError):
+            read_until_zero(f)
+
     def test_read_n_bytes(self):
         """
         Test L{pyzim.ioutil.read_n_bytes}.
@@ -84,3 +121,58 @@ class IoUtilTests(unittest.TestCase, TestBase):
             read_n_bytes(f, 1024, raise_on_incomplete=True)
         f.seek(0)
         self.assertEqual(read_n_bytes(f, 1024, raise_on_incomplete=False), b"test")
+
+    def test_read_n_bytes_fragmented(self):
+        """
+        Test L{pyzim.ioutil.read_n_bytes} with files returning partial reads.
+        """
+
+        class _FragmentedFile(io.RawIOBase):
+            """
+            A file that never returns more than 3 bytes per read.
+            """
+            def __init__(self, data):
+                self._data = data
+                self._pos = 0
+
+            def readable(self):
+                return True
+
+            def readinto(self, b):
+                chunk = self._data[self._pos:self._pos + min(3, len(b))]
+                b[:len(chunk)] = chunk
+                self._pos += len(chunk)
+                return len(chunk)
+
+        class _ReadOnlyFile(object):
+            """
+            A file that does not provide readinto() and returns partial reads.
+            """
+            def __init__(self, data):
+                self._f = _FragmentedFile(data)
+
+            def read(self, n):
+                return self._f.read(n)
+
+        data = b"0123456789abcdef" * 8
+        for cls in (_FragmentedFile, _ReadOnlyFile):
+            f = cls(data)
+            read_a = read_n_bytes(f, 10)
+            self.assertEqual(read_a, data[:10])
+            self.assertIsInstance(read_a, bytes)
+            self.assertEqual(read_n_bytes(f, 1024), data[10:])
+            self.assertEqual(read_n_bytes(f, 0), b"")
+            # small reads
+            f = cls(data)
+            self.assertEqual(read_n_bytes(f, 8), data[:8])
+            self.assertEqual(read_n_bytes(f, 2, raise_on_incomplete=True), data[8:10])
+            f = cls(data[:5])
+            with self.assertRaises(IOError):
+                read_n_bytes(f, 8, raise_on_incomplete=True)
+            f = cls(data[:5])
+            self.assertEqual(read_n_bytes(f, 8), data[:5])
+            f = cls(data)
+            with self.assertRaises(IOError):
+                read_n_bytes(f, 1024, raise_on_incomplete=True)
+            f = cls(data)
+            self.assertEqual(read_n_bytes(f, len(data), raise_on_incomplete=True), data)
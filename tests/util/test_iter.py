@@ -21,20 +21,19 @@ class IterTests(unittest.TestCase, TestBase):
             saw_redirects = False
             for urls in iter_by_cluster(zim):
                 self.assertTrue(urls)
-                e_0 = zim.get_entry_by_full_url(urls[0])
+                entries = zim.get_entries_by_full_urls(urls)
+                e_0 = entries[0]
                 if e_0.is_redirect:
                     # tests for redirects
                     self.assertFalse(saw_redirects)
-                    for url in urls:
-                        entry = zim.get_entry_by_full_url(url)
+                    for entry in entries:
                         self.assertTrue(entry.is_redirect)
                     saw_redirects = True
                 else:
                     self.assertFalse(saw_redirects)  # redirects _after_ content
                     self.assertGreater(e_0.cluster_number, last_cluster_num)
                     last_blob_num = -1
-                    for url in urls:
-                        entry = zim.get_entry_by_full_url(url)
+                    for entry in entries:
                         self.assertFalse(entry.is_redirect)
                         self.assertEqual(entry.cluster_number, e_0.cluster_number)
                         self.assertGreater(entry.blob_number, last_blob_num)
@@ -45,3 +44,38 @@ class IterTests(unittest.TestCase, TestBase):
         with self.assertRaises(TypeError):
             for url in iter_by_cluster(0):
                 pass
+
+    def test_iter_by_cluster_no_redirects(self):
+        """
+        Test L{pyzim.util.iter.iter_by_cluster} on an archive without redirects.
+        """
+        with self.open_temp_dir() as zimdir:
+            with zimdir.open(mode="w") as zim:
+                self.add_item(
+                    zim,
+                    namespace="C",
+                    url="home.txt",
+                    title="Welcome!",
+                    mimetype="text/plain",
+                    content="This is the mainpage.",
+                    is_article=True,
+                )
+                self.add_item(
+                    zim,
+                    namespace="C",
+                    url="other.txt",
+                    title="Other",
+                    mimetype="text/plain",
+                    content="Some other content",
+                    is_article=True,
+                )
+            with zimdir.open(mode="r") as zim:
+                groups = list(iter_by_cluster(zim))
+                self.assertTrue(groups)
+                for urls in groups:
+                    # no empty redirect group
+                    self.assertTrue(urls)
+                    for entry in zim.get_entries_by_full_urls(urls):
+                        self.assertFalse(entry.is_redirect)
+                self.assertIn("Chome.txt", groups[-1])
+                self.assertIn("Cother.txt", groups[-1])
@@ -1,6 +1,8 @@
 """
 Tests for L{pyzim.util.translator}.
 """
+import collections
+import hashlib
 import unittest
 
 from pyzim.util.translator import ZimTranslator, PathReaderMixIn
@@ -8,6 +10,26 @@ from pyzim.util.translator import ZimTranslator, PathReaderMixIn
 from ..base import TestBase
 
 
+BLOCK_SIZE = 65536
+
+
+def hash_chunks(chunks):
+    """
+    Hash a sequence of chunks of data without joining them.
+
+    @param chunks: chunks of data to hash
+    @type chunks: iterable of L{bytes}
+    @return: a tuple of (sha256 digest, total length)
+    @rtype: L{tuple} of (L{bytes}, L{int})
+    """
+    h = hashlib.sha256()
+    length = 0
+    for chunk in chunks:
+        h.update(chunk)
+        length += len(chunk)
+    return (h.digest(), length)
+
+
 class CustomTranslator(PathReaderMixIn, ZimTranslator):
     """
     A translator for testing.
@@ -19,8 +41,8 @@ class CustomTranslator(PathReaderMixIn, ZimTranslator):
 
     @ivar seen_redirects: a list of tuples of (src, target) of encountered redirects
     @type seen_redirects: L{list} of L{tuple} of (L{str}, L{str})
-    @ivar seen_metadata: a list of tuples of (key, value) of encountered metadata
-    @type seen_metadata: L{list} of L{tuple} of (L{str}, L{str})
+    @ivar seen_metadata: a list of tuples of (key, sha256 digest, length) of encountered metadata
+    @type seen_metadata: L{list} of L{tuple} of (L{str}, L{bytes}, L{int})
     @ivar finalized: True if C{self.finalize()} was called
     @type finalized: L{bool}
     """
@@ -38,8 +60,12 @@ class CustomTranslator(PathReaderMixIn, ZimTranslator):
 
     def handle_M(self, item):
         key = item.url
-        value = item.blob_source.get_blob().read(4096)
-        self.seen_metadata.append((key, value))
+        blob = item.blob_source.get_blob()
+        try:
+            digest, length = hash_chunks(iter(lambda: blob.read(BLOCK_SIZE), b""))
+        finally:
+            blob.close()
+        self.seen_metadata.append((key, digest, length))
 
     def handle_C(self, item):
         item.title = item.title.upper()
@@ -69,7 +95,8 @@ class TranslatorTests(unittest.TestCase, TestBase):
                 for entry in zim.iter_entries():
                     expected_num_entries += 1
                     if entry.namespace == "M":
-                        expected_seen_metadata.append((entry.url, entry.read()))
+                        digest, length = hash_chunks(entry.iter_read(buffersize=BLOCK_SIZE))
+                        expected_seen_metadata.append((entry.url, digest, length))
                         expected_num_entries -= 1  # will not be included
                     if entry.is_redirect:
                         expected_seen_redirects.append((entry.full_url, entry.follow().full_url))
@@ -80,13 +107,13 @@ class TranslatorTests(unittest.TestCase, TestBase):
             translator.translate()
             # check translator state
             self.assertTrue(translator.finalized)
-            self.assertListEqual(
-                list(sorted(translator.seen_metadata)),
-                list(sorted(expected_seen_metadata)),
+            self.assertEqual(
+                collections.Counter(translator.seen_metadata),
+                collections.Counter(expected_seen_metadata),
             )
-            self.assertListEqual(
-                list(sorted(translator.seen_redirects)),
-                list(sorted(expected_seen_redirects)),
+            self.assertEqual(
+                collections.Counter(translator.seen_redirects),
+                collections.Counter(expected_seen_redirects),
             )
             # now out.zim should contain the translated version
             # this means only uppercase titles and no M namespace entries